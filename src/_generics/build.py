@@ -0,0 +1,23 @@
+from _generics.registry import _get_origin
+from _generics.rows import _is_keywords
+
+
+def build_many(private_class, rows):
+    """Create private instances from rows of constructor arguments lazily.
+
+    Rows could be sequences of positional arguments like tuples, lists and
+    named tuples, or mappings of keyword arguments.
+
+    """
+    cls, slot = _get_origin(private_class)
+    return _build(cls, slot.wrap, rows)
+
+
+def _build(cls, wrap, rows):
+    # Instances are created without calling the generated constructor of the
+    # private class.
+    for row in rows:
+        if _is_keywords(row):
+            yield wrap(cls(**row))
+        else:
+            yield wrap(cls(*row))
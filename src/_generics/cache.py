@@ -0,0 +1,7 @@
+def _evict(cache):
+    # Caches are shared between threads without locks.  Other thread could
+    # evict the same entry or change the cache during the lookup.
+    try:
+        del cache[next(iter(cache))]
+    except (KeyError, RuntimeError, StopIteration):
+        pass
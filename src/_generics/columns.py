@@ -0,0 +1,109 @@
+from array import array
+from operator import index as to_index
+
+from _generics.exceptions import GenericInstanceError
+from _generics.fields import _get_parameters
+from _generics.private import _get_method_names
+from _generics.private import _Slot
+from _generics.registry import _get_origin
+from _generics.rows import _is_keywords
+from _generics.signature import _Empty
+from _generics.signature import _KEYWORD_ONLY
+
+
+def columnar(private_class, rows):
+    """Store encapsulated attributes of private instances column-wise.
+
+    Rows could be sequences of positional arguments like tuples, lists and
+    named tuples, or mappings of keyword arguments.  Instances are created
+    only when they are requested.
+
+    """
+    cls, slot = _get_origin(private_class)
+    parameters = _get_parameters(cls)[1:]
+    columns = [[] for _ in parameters]
+    for row in rows:
+        for column, value in zip(columns, _bind(parameters, row)):
+            column.append(value)
+    collection = object.__new__(Columns)
+    _state.set(collection, _State(cls, slot, parameters, columns))
+    return collection
+
+
+class Columns:
+    """Collection of private instances stored column-wise."""
+
+    __slots__ = ("_state",)
+
+    def __len__(self):
+        return _state.get(self).length
+
+    def __getitem__(self, index):
+        state = _state.get(self)
+        index = to_index(index)
+        return state.view([column[index] for column in state.columns])
+
+    def __iter__(self):
+        state = _state.get(self)
+        return map(state.view, zip(*state.columns))
+
+    def __repr__(self):
+        state = _state.get(self)
+        return f"Columns({state.slot.private_class!r}, {state.length})"
+
+    def apply(self, name, *args, **kwargs):
+        """Call the method of every instance in the collection."""
+        state = _state.get(self)
+        if name not in state.methods:
+            raise GenericInstanceError(f"{name!r} is not a public instance method")
+        private_class = state.slot.private_class
+        method = private_class.__dict__[name]
+        return [
+            method.__get__(view, private_class)(*args, **kwargs)
+            for view in map(state.view, zip(*state.columns))
+        ]
+
+
+class _State:
+    def __init__(self, cls, slot, parameters, columns):
+        self.cls = cls
+        self.slot = slot
+        self.positional = sum(param.kind != _KEYWORD_ONLY for param in parameters)
+        self.keywords = [
+            param.name for param in parameters if param.kind == _KEYWORD_ONLY
+        ]
+        self.columns = [_compact(column) for column in columns]
+        self.length = len(columns[0])
+        self.methods = _get_method_names(cls)
+
+    def view(self, values):
+        positional = self.positional
+        keywords = dict(zip(self.keywords, values[positional:]))
+        return self.slot.wrap(self.cls(*values[:positional], **keywords))
+
+
+def _bind(parameters, row):
+    if _is_keywords(row):
+        values = [row.get(param.name, param.default) for param in parameters]
+        extra = not row.keys() <= {param.name for param in parameters}
+    else:
+        given = len(row)
+        values = list(row)
+        values.extend(param.default for param in parameters[given:])
+        extra = given > len(parameters)
+    if extra or any(value is _Empty for value in values):
+        raise GenericInstanceError("Row should match encapsulated attributes")
+    return values
+
+
+def _compact(column):
+    for typecode, kind in [("q", int), ("d", float)]:
+        if column and all(type(value) is kind for value in column):
+            try:
+                return array(typecode, column)
+            except OverflowError:
+                pass
+    return column
+
+
+_state = _Slot(Columns, "_state")
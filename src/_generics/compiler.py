@@ -0,0 +1,79 @@
+from _generics.signature import _Empty
+from _generics.signature import _KEYWORD_ONLY
+from _generics.signature import _POSITIONAL_ONLY
+from _generics.signature import _VAR_KEYWORD
+from _generics.signature import _VAR_POSITIONAL
+
+
+def _compile(name, arguments, body, namespace, asynchronous=False):
+    prefix = "async def" if asynchronous else "def"
+    source = f"{prefix} {name}({arguments}):\n" + "".join(f"    {l}\n" for l in body)
+    code = _codes.get(source)
+    if code is None:
+        # Methods with the same shape of signature share compiled code.
+        code = _codes[source] = compile(source, "<generics>", "exec")
+    exec(code, namespace)
+    function = namespace[name]
+    function.__qualname__ = namespace["__qualname__"]
+    return function
+
+
+def _get_name(name, parameters):
+    names = {parameter.name for parameter in parameters}
+    while name in names:
+        name = f"_{name}"
+    return name
+
+
+def _get_annotations(parameters):
+    return {
+        parameter.name: parameter.annotation
+        for parameter in parameters
+        if parameter.annotation is not _Empty
+    }
+
+
+def _get_definition_arguments(parameters, namespace):
+    definition = [_get_definition(parameter, namespace) for parameter in parameters]
+    return ", ".join(_add_markers(definition, parameters))
+
+
+def _get_call_arguments(parameters):
+    return ", ".join(_get_call(parameter) for parameter in parameters)
+
+
+def _get_definition(parameter, namespace):
+    if parameter.kind == _VAR_POSITIONAL:
+        return f"*{parameter.name}"
+    elif parameter.kind == _VAR_KEYWORD:
+        return f"**{parameter.name}"
+    elif parameter.default is _Empty:
+        return parameter.name
+    else:
+        default = f"_default_{parameter.name}"
+        namespace[default] = parameter.default
+        return f"{parameter.name}={default}"
+
+
+def _get_call(parameter):
+    if parameter.kind == _VAR_POSITIONAL:
+        return f"*{parameter.name}"
+    elif parameter.kind == _VAR_KEYWORD:
+        return f"**{parameter.name}"
+    elif parameter.kind == _KEYWORD_ONLY:
+        return f"{parameter.name}={parameter.name}"
+    else:
+        return parameter.name
+
+
+def _add_markers(definition, parameters):
+    kinds = [parameter.kind for parameter in parameters]
+    if _KEYWORD_ONLY in kinds and _VAR_POSITIONAL not in kinds:
+        definition.insert(kinds.index(_KEYWORD_ONLY), "*")
+    if _POSITIONAL_ONLY in kinds:
+        last = len(kinds) - kinds[::-1].index(_POSITIONAL_ONLY)
+        definition.insert(last, "/")
+    return definition
+
+
+_codes = {}
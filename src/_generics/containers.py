@@ -0,0 +1,82 @@
+from _generics.registry import _registry
+
+
+def _define_rewrap_function(classes, slot):
+    # Instances of the own class are wrapped with the slot of the calling
+    # method.  The same class could be decorated more than once, so the
+    # registry is used only for instances of other private classes.
+    own = dict.fromkeys(classes, slot)
+
+    def rewrap(result):
+        return _rewrap(result, own)
+
+    return rewrap
+
+
+def _rewrap(result, own):
+    kind = type(result)
+    slot = own.get(kind) or _registry.get(kind)
+    if slot is not None:
+        return slot.wrap(result)
+    rewrap = _containers.get(kind)
+    if rewrap is not None:
+        return rewrap(result, own)
+    return result
+
+
+def _rewrap_list(result, own):
+    items = _wrap_items(result, own)
+    return result if items is None else items
+
+
+def _rewrap_tuple(result, own):
+    items = _wrap_items(result, own)
+    return result if items is None else tuple(items)
+
+
+def _rewrap_set(result, own):
+    items = _wrap_items(result, own)
+    return result if items is None else set(items)
+
+
+def _rewrap_frozenset(result, own):
+    items = _wrap_items(result, own)
+    return result if items is None else frozenset(items)
+
+
+def _rewrap_dict(result, own):
+    items = _wrap_items(result.values(), own)
+    return result if items is None else dict(zip(result, items))
+
+
+def _wrap_items(items, own):
+    # Nothing is copied if there are no private instances in the container.
+    kinds = set(map(type, items))
+    wraps = _get_wraps(kinds, own)
+    if not wraps:
+        return None
+    elif len(kinds) == 1:
+        [wrap] = wraps.values()
+        return list(map(wrap, items))
+    else:
+        return [
+            wraps[type(item)](item) if type(item) in wraps else item for item in items
+        ]
+
+
+def _get_wraps(kinds, own):
+    wraps = {}
+    for kind in kinds:
+        slot = own.get(kind) or _registry.get(kind)
+        if slot is not None:
+            wraps[kind] = slot.wrap
+    return wraps
+
+
+_containers = {
+    list: _rewrap_list,
+    tuple: _rewrap_tuple,
+    set: _rewrap_set,
+    frozenset: _rewrap_frozenset,
+    dict: _rewrap_dict,
+}
@@ -1,18 +1,175 @@
+from weakref import WeakKeyDictionary
+from weakref import WeakValueDictionary
+
+from _generics.exceptions import GenericClassError
+from _generics.exceptions import GenericInstanceError
+from _generics.signature import _is_coroutine_function
+
+
 class Delegate:
     """Create decorator class in true sense of OOP."""
 
-    def __init__(self, f):
+    def __init__(self, f, cache=None, batch=None):
         self.f = f
+        self.cache = cache
+        self.batch = batch
+
+
+def delegate(f=None, *, cache=None, batch=None):
+    """Create decorator class in true sense of OOP.
+
+    Dispatched methods are reused for up to `cache` names per instance.
+
+    Calls dispatched within `batch` seconds are passed to the coroutine
+    function together.
+
+    """
+    if cache is not None and (type(cache) is not int or cache < 1):
+        raise GenericClassError("Delegate cache size should be a positive integer")
+    if batch is not None and (type(batch) not in {int, float} or batch < 0):
+        raise GenericClassError("Delegate batch window should be a non-negative number")
+    if f is None:
+        return lambda f: _make_delegate(f, cache, batch)
+    return _make_delegate(f, cache, batch)
+
+
+def _make_delegate(f, cache, batch):
+    if batch is not None and not _is_coroutine_function(f):
+        raise GenericClassError("Batch delegate should be a coroutine function")
+    return Delegate(f, cache, batch)
+
+
+def invalidate(instance):
+    """Forget dispatched methods and memoized results cached on the instance."""
+    caches = [
+        attribute.invalidate
+        for attribute in type(instance).__dict__.values()
+        if hasattr(attribute, "invalidate")
+    ]
+    if not caches:
+        raise GenericInstanceError("Instance does not cache delegated methods")
+    for forget in caches:
+        forget(instance)
+
+
+def _dynamic(f, wrap, probe=None):
+    if probe is not None:
+        return _instrumented(f, wrap, probe)
+    elif _is_coroutine_function(f):
+
+        def _getattr(instance, name):
+            async def _bound_method(*args, **kwargs):
+                return wrap(await f(instance, name, args, kwargs))
+
+            return _bound_method
+
+    else:
+
+        def _getattr(instance, name):
+            def _bound_method(*args, **kwargs):
+                return wrap(f(instance, name, args, kwargs))
+
+            return _bound_method
+
+    return _getattr
+
 
+def _instrumented(f, wrap, probe):
+    if _is_coroutine_function(f):
 
-delegate = Delegate
+        def _getattr(instance, name):
+            async def _bound_method(*args, **kwargs):
+                with probe.observe(name) as call:
+                    result = await f(instance, name, args, kwargs)
+                return call.done(wrap(result), result)
 
+            return _bound_method
+
+    else:
+
+        def _getattr(instance, name):
+            def _bound_method(*args, **kwargs):
+                with probe.observe(name) as call:
+                    result = f(instance, name, args, kwargs)
+                return call.done(wrap(result), result)
+
+            return _bound_method
+
+    return _getattr
+
+
+def _batched(f, window, wrap):
+    from asyncio import get_running_loop
+
+    # Batches are kept alive only by flushes scheduled in their loops, so
+    # batches of loops closed before the flush are freed together with them.
+    pending = WeakKeyDictionary()
 
-def _dynamic(f):
     def _getattr(instance, name):
         def _bound_method(*args, **kwargs):
-            return f(instance, name, args, kwargs)
+            loop = get_running_loop()
+            batches = pending.get(loop)
+            if batches is None:
+                batches = pending[loop] = WeakValueDictionary()
+            batch = batches.get((id(instance), name))
+            if batch is None:
+                batch = batches[id(instance), name] = _Batch(instance, name)
+                loop.call_later(window, _flush, f, wrap, batches, batch)
+            future = loop.create_future()
+            batch.calls.append((args, kwargs, future))
+            return future
 
         return _bound_method
 
     return _getattr
+
+
+class _Batch:
+    # Batch refers to its instance, so the id of the instance in the key
+    # could not be reused by another object while the batch is pending.
+
+    __slots__ = ("instance", "name", "calls", "__weakref__")
+
+    def __init__(self, instance, name):
+        self.instance = instance
+        self.name = name
+        self.calls = []
+
+
+def _flush(f, wrap, batches, batch):
+    del batches[id(batch.instance), batch.name]
+    futures = [future for _, _, future in batch.calls]
+    calls = [(args, kwargs) for args, kwargs, _ in batch.calls]
+    task = futures[0].get_loop().create_task(f(batch.instance, batch.name, calls))
+    task.add_done_callback(lambda task: _resolve(task, futures, wrap))
+
+
+def _resolve(task, futures, wrap):
+    # Futures cancelled by their callers are left as they are.
+    if task.cancelled():
+        _cancel(futures)
+    elif task.exception() is not None:
+        _fail(futures, task.exception())
+    elif len(task.result()) != len(futures):
+        message = "Batch delegate should return one result per call"
+        _fail(futures, GenericInstanceError(message))
+    else:
+        _succeed(futures, map(wrap, task.result()))
+
+
+def _cancel(futures):
+    for future in futures:
+        if not future.done():
+            future.cancel()
+
+
+def _fail(futures, error):
+    for future in futures:
+        if not future.done():
+            future.set_exception(error)
+
+
+def _succeed(futures, results):
+    for future, result in zip(futures, results):
+        if not future.done():
+            future.set_result(result)
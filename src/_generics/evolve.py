@@ -0,0 +1,84 @@
+from weakref import WeakKeyDictionary
+
+from _generics.exceptions import GenericClassError
+from _generics.exceptions import GenericInstanceError
+from _generics.fields import _get_parameters
+from _generics.private import _PrivateType
+from _generics.registry import _get_origin
+from _generics.registry import _registry
+
+
+def evolve(instance, **changes):
+    """Create a copy of encapsulated instance with changes.
+
+    The copy is encapsulated by the method returning it, the same way as
+    instances created by the origin class.
+
+    """
+    cls = type(instance)
+    if type(cls) is _PrivateType:
+        raise GenericInstanceError("Evolve encapsulated instance inside its methods")
+    slot = _registry.get(cls)
+    if slot is None:
+        raise GenericClassError("Class should be decorated with @private")
+    origin, _ = _get_origin(slot.private_class)
+    return _get_copy(origin)(origin, instance, changes)
+
+
+def _get_copy(cls):
+    attributes = cls.__dict__
+    if "__attrs_attrs__" in attributes:
+        return _copy_attrs
+    elif "__pydantic_model__" in attributes or "__post_init__" in attributes:
+        return _copy_dataclass
+    elif "__slots__" in attributes:
+        return _copy_slots
+    else:
+        return _copy_dict
+
+
+def _copy_attrs(origin, instance, changes):
+    from attr import evolve as evolve_attrs
+
+    return evolve_attrs(instance, **changes)
+
+
+def _copy_dataclass(origin, instance, changes):
+    from dataclasses import replace
+
+    return replace(instance, **changes)
+
+
+def _copy_slots(origin, instance, changes):
+    from copy import copy
+
+    return _change(origin, instance, copy(instance), changes)
+
+
+def _copy_dict(origin, instance, changes):
+    # Constructor is not called, only changed attributes are set.
+    result = object.__new__(type(instance))
+    result.__dict__.update(instance.__dict__)
+    return _change(origin, instance, result, changes)
+
+
+def _change(origin, instance, result, changes):
+    fields = _get_field_names(origin)
+    for name, value in changes.items():
+        if name not in fields or not hasattr(instance, name):
+            raise GenericInstanceError(f"{name!r} is not an encapsulated attribute")
+        object.__setattr__(result, name, value)
+    return result
+
+
+def _get_field_names(origin):
+    # Only attributes set from constructor arguments could be changed, so
+    # methods and attributes computed by the constructor stay untouched.
+    names = _field_names.get(origin)
+    if names is None:
+        names = {parameter.name for parameter in _get_parameters(origin)[1:]}
+        _field_names[origin] = names
+    return names
+
+
+_field_names = WeakKeyDictionary()
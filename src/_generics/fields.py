@@ -0,0 +1,43 @@
+from _generics.signature import _get_signature
+
+
+def _get_parameters(cls):
+    init = cls.__dict__.get("__init__")
+    if init is None:
+        return []
+    parameters, _ = _get_signature(_get_generated_init(cls, init))
+    return parameters
+
+
+def _get_generated_init(cls, init):
+    # Pydantic dataclasses wrap `__init__` generated by dataclasses module.
+    # Generated constructor is read from its code without inspect module.
+    wrapped = getattr(init, "__wrapped__", None)
+    if "__dataclass_fields__" in cls.__dict__ and _is_generated(wrapped, "<string>"):
+        return wrapped
+    return init
+
+
+def _get_equality_fields(cls):
+    # Only attributes compared by generated `__eq__` are known.  Classes with
+    # their own equality are left unhashable.
+    eq = cls.__dict__.get("__eq__")
+    if "__attrs_attrs__" in cls.__dict__ and _is_generated(eq, "<attrs generated"):
+        return [
+            (attribute.name, getattr(attribute, "eq_key", None) or _same)
+            for attribute in cls.__attrs_attrs__
+            if attribute.eq
+        ]
+    elif "__dataclass_fields__" in cls.__dict__ and _is_generated(eq, "<string>"):
+        from dataclasses import fields
+
+        return [(field.name, _same) for field in fields(cls) if field.compare]
+
+
+def _same(value):
+    return value
+
+
+def _is_generated(func, filename):
+    code = getattr(func, "__code__", None)
+    return code is not None and code.co_filename.startswith(filename)
@@ -0,0 +1,47 @@
+from _generics.exceptions import GenericInstanceError
+from _generics.fields import _get_equality_fields
+
+
+def _define_frozen_class(cls):
+    # Frozen class keeps the layout of the origin class, so instances of the
+    # origin class could be frozen by the class assignment.
+    def __new__(frozen_class, *args, **kwargs):
+        instance = cls(*args, **kwargs)
+        object.__setattr__(instance, "__class__", frozen_class)
+        return instance
+
+    def __init__(instance, *args, **kwargs):
+        pass
+
+    def __setattr__(instance, name, value):
+        raise GenericInstanceError("Frozen instance could not be changed")
+
+    def __delattr__(instance, name):
+        raise GenericInstanceError("Frozen instance could not be changed")
+
+    def __reduce_ex__(instance, protocol):
+        # Copies are restored as origin instances and frozen on encapsulation.
+        func, args, *rest = cls.__reduce_ex__(instance, protocol)
+        args = tuple(cls if arg is frozen_class else arg for arg in args)
+        return (func, args, *rest)
+
+    def __hash__(instance):
+        # Classes with generated equality but without hash are hashed by
+        # compared attributes, which could not change anymore.
+        return hash(tuple([key(getattr(instance, name)) for name, key in fields]))
+
+    namespace = {
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__slots__": (),
+        "__new__": __new__,
+        "__init__": __init__,
+        "__setattr__": __setattr__,
+        "__delattr__": __delattr__,
+        "__reduce_ex__": __reduce_ex__,
+    }
+    fields = _get_equality_fields(cls) if cls.__hash__ is None else None
+    if fields is not None:
+        namespace["__hash__"] = __hash__
+    frozen_class = type(cls.__name__, (cls,), namespace)
+    return frozen_class
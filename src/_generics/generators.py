@@ -0,0 +1,48 @@
+class _Stream:
+    # Items are wrapped one by one as the generator is consumed.  Values,
+    # exceptions and closing are passed to the origin generator as is, so
+    # its return value and errors reach the caller unchanged.
+
+    __slots__ = ("_generator", "_wrap")
+
+    def __init__(self, generator, wrap):
+        self._generator = generator
+        self._wrap = wrap
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self._wrap(next(self._generator))
+
+    def send(self, value):
+        return self._wrap(self._generator.send(value))
+
+    def throw(self, *args):
+        return self._wrap(self._generator.throw(*args))
+
+    def close(self):
+        self._generator.close()
+
+
+class _AsyncStream:
+    __slots__ = ("_generator", "_wrap")
+
+    def __init__(self, generator, wrap):
+        self._generator = generator
+        self._wrap = wrap
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return self._wrap(await self._generator.__anext__())
+
+    async def asend(self, value):
+        return self._wrap(await self._generator.asend(value))
+
+    async def athrow(self, *args):
+        return self._wrap(await self._generator.athrow(*args))
+
+    async def aclose(self):
+        await self._generator.aclose()
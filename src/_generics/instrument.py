@@ -0,0 +1,120 @@
+from threading import Lock
+from time import perf_counter
+from weakref import WeakKeyDictionary
+
+
+def instrument(on_call=None, on_return=None, on_error=None):
+    """Call hooks around methods of private instances until removed.
+
+    `on_call` receives class and method names.  `on_return` receives them
+    together with the call duration in seconds and whether the result was
+    wrapped into a private instance.  `on_error` receives the raised exception
+    instead of the last one.
+
+    """
+    instrumentation = Instrumentation(on_call, on_return, on_error)
+    with _lock:
+        _active.append(instrumentation)
+        _apply()
+    return instrumentation
+
+
+class Instrumentation:
+    """Hooks called around methods of private instances."""
+
+    def __init__(self, on_call, on_return, on_error):
+        self.on_call = on_call
+        self.on_return = on_return
+        self.on_error = on_error
+
+    def remove(self):
+        """Restore methods of private instances without hooks."""
+        with _lock:
+            if self in _active:
+                _active.remove(self)
+                _apply()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.remove()
+
+
+def _register_instrumented(owner, name, class_name):
+    # Functions which could be instrumented know how to create an instrumented
+    # version of themselves.  Other functions are always bare.
+    if hasattr(owner.__dict__[name], "_instrument"):
+        with _lock:
+            _owners[owner] = name, class_name
+            if _active:
+                _swap(owner, name, class_name)
+
+
+def _apply():
+    for owner, (name, class_name) in list(_owners.items()):
+        _swap(owner, name, class_name)
+
+
+def _swap(owner, name, class_name):
+    current = owner.__dict__[name]
+    bare = getattr(current, "_bare", current)
+    if _active:
+        instrumented = bare._instrument(_Probe(class_name, _active))
+        instrumented._bare = bare
+        setattr(owner, name, instrumented)
+    else:
+        setattr(owner, name, bare)
+
+
+class _Probe:
+    def __init__(self, class_name, instrumentations):
+        self.class_name = class_name
+        self.on_call = [i.on_call for i in instrumentations if i.on_call]
+        self.on_return = [i.on_return for i in instrumentations if i.on_return]
+        self.on_error = [i.on_error for i in instrumentations if i.on_error]
+
+    def observe(self, name):
+        for on_call in self.on_call:
+            on_call(self.class_name, name)
+        return _Call(self, name, perf_counter())
+
+    def done(self, name, start, rewrapped):
+        duration = perf_counter() - start
+        for on_return in self.on_return:
+            on_return(self.class_name, name, duration, rewrapped)
+
+    def error(self, name, start, error):
+        duration = perf_counter() - start
+        for on_error in self.on_error:
+            on_error(self.class_name, name, duration, error)
+
+
+class _Call:
+    # Errors are reported when they leave the block, and propagate as is.
+    __slots__ = ("probe", "name", "start")
+
+    def __init__(self, probe, name, start):
+        self.probe = probe
+        self.name = name
+        self.start = start
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, error_type, error, traceback):
+        if error_type is not None:
+            self.probe.error(self.name, self.start, error)
+
+    def done(self, wrapped, result):
+        self.probe.done(self.name, self.start, wrapped is not result)
+        return wrapped
+
+
+_lock = Lock()
+
+
+_active = []
+
+
+_owners = WeakKeyDictionary()
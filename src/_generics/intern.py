@@ -0,0 +1,73 @@
+from threading import Lock
+from weakref import WeakKeyDictionary
+from weakref import WeakValueDictionary
+
+
+class _Interned:
+    # Private instances are kept while clients refer to them.  Unhashable
+    # arguments and attributes are never interned.  Types are part of keys,
+    # so equal values of different types like `1` and `True` do not collide.
+
+    def __init__(self, wrap):
+        self.instances = WeakValueDictionary()
+        self.states = WeakValueDictionary()
+        self.lock = Lock()
+        self.wrap_instance = wrap
+
+    def lookup(self, key):
+        try:
+            return self.instances.get(key)
+        except TypeError:
+            return None
+
+    def store(self, key, instance):
+        # Threads constructing equal instances get the one interned first.
+        found = self.wrap(instance)
+        try:
+            self.instances[key] = found
+        except TypeError:
+            pass
+        return found
+
+    def wrap(self, instance):
+        # Instances created without the constructor are interned by their
+        # encapsulated attributes, which could not change anymore.
+        key = _get_state(instance)
+        with self.lock:
+            try:
+                found = self.states.get(key)
+            except TypeError:
+                return self.wrap_instance(instance)
+            if found is None:
+                found = self.states[key] = self.wrap_instance(instance)
+            return found
+
+
+def _get_state(instance):
+    state = dict(getattr(instance, "__dict__", ()))
+    for name in _get_slot_names(type(instance)):
+        state[name] = getattr(instance, name, _unset)
+    return tuple([(name, value, type(value)) for name, value in sorted(state.items())])
+
+
+def _get_slot_names(cls):
+    names = _slot_names.get(cls)
+    if names is None:
+        names = _slot_names[cls] = [
+            name
+            for base in cls.__mro__
+            for name in _get_slots(base)
+            if name not in {"__dict__", "__weakref__"}
+        ]
+    return names
+
+
+def _get_slots(cls):
+    names = cls.__dict__.get("__slots__", ())
+    return [names] if isinstance(names, str) else names
+
+
+_slot_names = WeakKeyDictionary()
+
+
+_unset = object()
@@ -0,0 +1,96 @@
+from functools import wraps
+
+from _generics.cache import _evict
+from _generics.exceptions import GenericClassError
+from _generics.signature import _is_async_generator_function
+from _generics.signature import _is_coroutine_function
+from _generics.signature import _is_generator_function
+
+
+class Memoize:
+    """Cache results of the instance method."""
+
+    def __init__(self, f, size=128):
+        self.f = f
+        self.size = size
+
+    def __get__(self, instance, owner):
+        # Calls of the origin class methods are not cached.
+        return self.f.__get__(instance, owner)
+
+
+def memoize(f=None, *, size=128):
+    """Cache results of the instance method.
+
+    Methods without arguments are called once per instance.  Results of methods
+    with arguments are kept for up to `size` recently used arguments.
+
+    """
+    if type(size) is not int or size < 1:
+        raise GenericClassError("Memoize cache size should be a positive integer")
+    if f is None:
+        return lambda f: _make_memoize(f, size)
+    return _make_memoize(f, size)
+
+
+def _make_memoize(f, size):
+    if (
+        _is_coroutine_function(f)
+        or _is_generator_function(f)
+        or _is_async_generator_function(f)
+    ):
+        message = "Coroutine and generator methods could not be memoized"
+        raise GenericClassError(message)
+    return Memoize(f, size)
+
+
+def _memoized(name, call, cache_slot):
+    @wraps(call)
+    def __call__(method):
+        caches = _get_caches(cache_slot, method.__self__)
+        try:
+            return caches[name]
+        except KeyError:
+            result = caches[name] = call(method)
+            return result
+
+    return __call__
+
+
+def _memoized_arguments(name, call, cache_slot, size):
+    @wraps(call)
+    def __call__(method, *args, **kwargs):
+        caches = _get_caches(cache_slot, method.__self__)
+        cache = caches.get(name)
+        if cache is None:
+            cache = caches.setdefault(name, {})
+        key = args + (_keywords, *kwargs.items()) if kwargs else args
+        try:
+            result = cache.pop(key)
+        except KeyError:
+            result = call(method, *args, **kwargs)
+            if len(cache) >= size:
+                _evict(cache)
+        cache[key] = result
+        return result
+
+    return __call__
+
+
+def _get_caches(cache_slot, wrapper):
+    try:
+        return cache_slot.get(wrapper)
+    except AttributeError:
+        caches = {}
+        cache_slot.set(wrapper, caches)
+        return caches
+
+
+def _define_invalidate_function(cache_slot):
+    def invalidate(wrapper):
+        cache_slot.set(wrapper, {})
+
+    return invalidate
+
+
+_keywords = object()
@@ -0,0 +1,72 @@
+from itertools import islice
+from time import perf_counter
+
+from _generics.exceptions import GenericClassError
+from _generics.exceptions import GenericInstanceError
+from _generics.private import _get_method_names
+from _generics.registry import _get_origin
+from _generics.serialization import _import
+
+
+def parallel_map(
+    instances, name, *args, chunksize=1000, ordered=True, processes=None, on_chunk=None
+):
+    """Call the method of private instances in a pool of processes.
+
+    Results are given in the order of instances unless `ordered` is false.
+    `on_chunk` is called with the chunk number, its size and the seconds
+    spent on it in the worker process.  Worker processes find the class by
+    its name, so it should be decorated with `@private` at the module level.
+
+    """
+    instances = list(instances)
+    for private_class in set(map(type, instances)):
+        cls, _ = _get_origin(private_class)
+        if not _is_importable(private_class, cls):
+            message = "Class should be decorated with @private at the module level"
+            raise GenericClassError(message)
+        if name not in _get_method_names(cls):
+            raise GenericInstanceError(f"{name!r} is not a public instance method")
+    chunks = _chunks(instances, chunksize)
+    return _map(chunks, name, args, ordered, processes, on_chunk)
+
+
+def _is_importable(private_class, cls):
+    # Processes started with spawn or forkserver do not have classes
+    # decorated by a call or inside of a function.
+    try:
+        return _import(cls.__module__, cls.__qualname__) is private_class
+    except (ImportError, AttributeError):
+        return False
+
+
+def _chunks(instances, chunksize):
+    iterator = iter(instances)
+    chunk = list(islice(iterator, chunksize))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunksize))
+
+
+def _map(chunks, name, args, ordered, processes, on_chunk):
+    # Process pool imports multiprocessing, so it is loaded on the first use.
+    from concurrent.futures import as_completed
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(processes) as executor:
+        futures = {}
+        for number, chunk in enumerate(chunks):
+            futures[executor.submit(_call, chunk, name, args)] = number
+        for future in futures if ordered else as_completed(futures):
+            results, seconds = future.result()
+            if on_chunk is not None:
+                on_chunk(futures[future], len(results), seconds)
+            yield from results
+
+
+def _call(instances, name, args):
+    # Instances and results cross the process boundary with pickle, so
+    # results of the private class are private in the parent as well.
+    start = perf_counter()
+    results = [getattr(instance, name)(*args) for instance in instances]
+    return results, perf_counter() - start
@@ -1,16 +1,62 @@
-from inspect import signature
+from copyreg import pickle
 from types import MemberDescriptorType
 
+from _generics.cache import _evict
+from _generics.compiler import _compile
+from _generics.compiler import _get_annotations
+from _generics.compiler import _get_call_arguments
+from _generics.compiler import _get_definition_arguments
+from _generics.compiler import _get_name
+from _generics.containers import _define_rewrap_function
+from _generics.delegate import _batched
 from _generics.delegate import _dynamic
 from _generics.delegate import Delegate
 from _generics.exceptions import GenericClassError
-
-
-def private(cls):
-    """Create class with private attributes."""
+from _generics.fields import _get_parameters
+from _generics.frozen import _define_frozen_class
+from _generics.generators import _AsyncStream
+from _generics.generators import _Stream
+from _generics.instrument import _register_instrumented
+from _generics.intern import _Interned
+from _generics.memoize import _define_invalidate_function
+from _generics.memoize import _memoized
+from _generics.memoize import _memoized_arguments
+from _generics.memoize import Memoize
+from _generics.registry import _register
+from _generics.registry import _registry
+from _generics.serialization import _reduce_instance
+from _generics.serialization import _reduce_private_class
+from _generics.signature import _Empty
+from _generics.signature import _get_signature
+from _generics.signature import _is_async_generator_function
+from _generics.signature import _is_coroutine_function
+from _generics.signature import _is_generator_function
+from _generics.signature import _Parameter
+from _generics.signature import _POSITIONAL_ONLY
+from _generics.signature import _POSITIONAL_OR_KEYWORD
+from _generics.signature import _VAR_KEYWORD
+from _generics.signature import _VAR_POSITIONAL
+
+
+def private(cls=None, *, containers=False, frozen=False, intern=False, eq=False):
+    """Create class with private attributes.
+
+    Instances of private classes returned inside lists, tuples, sets and dicts
+    are private as well if `containers` is set.  Encapsulated instances of
+    `frozen` classes could not be changed.  Constructor of `intern` classes
+    returns the same instance for equal arguments.  Instances of `eq` classes
+    are compared and hashed by their encapsulated instances.
+
+    """
+    if cls is None:
+        return lambda cls: _make_private(cls, containers, frozen, intern, eq)
+    return _make_private(cls, containers, frozen, intern, eq)
+
+
+def _make_private(cls, containers, frozen, intern, eq):
     methods = _get_methods(cls)
-    init = _get_init(cls)
-    fields = _get_fields(init)
+    parameters = _get_parameters(cls)
+    fields = _get_fields(parameters)
     _check_bases(cls)
     _check_methods(methods)
     _check_fields(fields)
@@ -18,11 +64,31 @@ def private(cls):
     _check_private_fields(fields)
     _check_variable_keyword_fields(fields)
     _check_variable_positional_fields(fields)
+    _check_intern(frozen, intern)
     class_name = _get_class_name(cls)
-    defined = _define_class_methods(methods)
-    defined["__new__"] = _define_new_class_method(cls, methods)
-    defined["__init__"] = init
-    return _PrivateType(class_name, (), defined)
+    private_class = _PrivateType(
+        class_name, (), {"__slots__": _get_slots(methods, frozen, intern, eq)}
+    )
+    slots = _get_slot_objects(private_class)
+    slot = slots["_instance"]
+    _register(cls, slot)
+    if frozen:
+        _freeze(cls, slot, methods)
+    # Interned slot wraps instances, so it is set before methods refer to it.
+    new = _define_new(cls, parameters, slot, intern)
+    defined = _define_class_methods(methods, slots, containers)
+    defined["__new__"] = new
+    defined["__init__"] = _define_init_class_method(cls, parameters)
+    if eq:
+        defined["__eq__"] = _define_eq_instance_method(slot)
+        defined["__hash__"] = _define_hash_instance_method(slots)
+    defined["__repr__"] = _define_repr_instance_method(slot)
+    defined["__reduce_ex__"] = _define_reduce_instance_method(cls, slot)
+    for name, attribute in defined.items():
+        setattr(private_class, name, attribute)
+    if "__getattr__" in defined:
+        _register_instrumented(private_class, "__getattr__", class_name)
+    return private_class
 
 
 def _get_methods(cls):
@@ -34,25 +100,45 @@ def _get_methods(cls):
     return methods
 
 
-def _get_init(cls):
-    return cls.__dict__.get("__init__")
+def _get_method_names(cls):
+    return {
+        method.name
+        for method in _get_methods(cls)
+        if not isinstance(method, _DelegateMethod)
+    }
+
+
+def _get_slots(methods, frozen, intern, eq):
+    slots = ["_instance"]
+    for method in methods:
+        slots.extend(method.slots)
+    if frozen and eq:
+        slots.append("_hash")
+    if intern:
+        slots.append("__weakref__")
+    return tuple(dict.fromkeys(slots))
 
 
-def _get_fields(init):
-    if init is None:
-        return []
-    params = iter(signature(init).parameters.items())
-    next(params)  # Skip self constructor argument.
-    return [_get_field_name(name, param) for name, param in params]
+def _get_slot_objects(private_class):
+    return {
+        name: _Slot(private_class, name)
+        for name in private_class.__slots__
+        if not _is_dunder(name)
+    }
 
 
-def _get_field_name(name, param):
-    if param.kind is param.VAR_POSITIONAL:
-        return f"*{name}"
-    elif param.kind is param.VAR_KEYWORD:
-        return f"**{name}"
+def _get_fields(parameters):
+    params = parameters[1:]  # Skip self constructor argument.
+    return [_get_field_name(param) for param in params]
+
+
+def _get_field_name(param):
+    if param.kind == _VAR_POSITIONAL:
+        return f"*{param.name}"
+    elif param.kind == _VAR_KEYWORD:
+        return f"**{param.name}"
     else:
-        return name
+        return param.name
 
 
 def _check_bases(cls):
@@ -100,34 +186,334 @@ def _check_variable_positional_fields(fields):
             )
 
 
-def _define_class_methods(methods):
-    return {method.name: method.to_class(methods) for method in methods}
+def _check_intern(frozen, intern):
+    if intern and not frozen:
+        raise GenericClassError("Interned class should be frozen")
 
 
-def _define_instance_methods(instance, methods):
-    return {method.name: method.to_instance(instance, methods) for method in methods}
-
+def _freeze(cls, slot, methods):
+    # Methods wrap instances of both classes, since methods of the origin
+    # class could create instances of it.
+    frozen_class = _define_frozen_class(cls)
+    slot.freeze(cls, frozen_class)
+    _registry[frozen_class] = slot
+    for method in methods:
+        method.classes = (cls, frozen_class)
 
-def _define_new_class_method(cls, methods):
-    def method(_, *args, **kwargs):
-        instance = cls(*args, **kwargs)
-        return _wrap(instance, methods)
 
+def _define_new(cls, parameters, slot, intern):
+    if intern:
+        return _define_interned_new_class_method(cls, parameters, slot.intern())
+    else:
+        return _define_new_class_method(cls, parameters, slot)
+
+
+def _define_class_methods(methods, slots, containers):
+    return {method.name: method.to_class(slots, containers) for method in methods}
+
+
+def _define_new_class_method(cls, parameters, slot):
+    namespace = {
+        "__qualname__": f"{_get_class_name(cls)}.__new__",
+        "_cls": cls,
+        "_new": object.__new__,
+        "_set": slot.set,
+    }
+    definition = _get_definition_arguments(parameters, namespace)
+    call = _get_call_arguments(parameters[1:])
+    body = [
+        f"_wrapper = _new({parameters[0].name})",
+        f"_set(_wrapper, _cls({call}))",
+        "return _wrapper",
+    ]
+    method = _compile("__new__", definition, body, namespace)
+    method.__annotations__ = _get_annotations(parameters)
+    return staticmethod(method)
+
+
+def _define_init_class_method(cls, parameters):
+    # Encapsulated instance is set by the constructor, so `__init__` called
+    # on the existing instance could not replace it.  It is defined only to
+    # keep the signature of the origin class constructor.
+    namespace = {"__qualname__": f"{_get_class_name(cls)}.__init__"}
+    definition = _get_definition_arguments(parameters, namespace)
+    method = _compile("__init__", definition, ["pass"], namespace)
+    method.__annotations__ = _get_annotations(parameters)
     return method
 
 
-def _define_repr_instance_method(instance):
-    def method(_):
-        return f"Private::{instance!r}"
+def _define_interned_new_class_method(cls, parameters, interned):
+    key = _get_name("_key", parameters)
+    found = _get_name("_found", parameters)
+    namespace = {
+        "__qualname__": f"{_get_class_name(cls)}.__new__",
+        "_cls": cls,
+        "_lookup": interned.lookup,
+        "_store": interned.store,
+    }
+    definition = _get_definition_arguments(parameters, namespace)
+    names = "".join(
+        f"{parameter.name}, type({parameter.name}), " for parameter in parameters[1:]
+    )
+    call = _get_call_arguments(parameters[1:])
+    body = [
+        f"{key} = ({names})",
+        f"{found} = _lookup({key})",
+        f"if {found} is None:",
+        f"    {found} = _store({key}, _cls({call}))",
+        f"return {found}",
+    ]
+    method = _compile("__new__", definition, body, namespace)
+    method.__annotations__ = _get_annotations(parameters)
+    return staticmethod(method)
+
+
+def _define_call_instance_method(method, slot, containers, probe=None):
+    parameters, returns = _get_method_signature(method.func)
+    func = _get_name("_func", parameters)
+    namespace = {
+        "__qualname__": f"{_get_class_name(method.cls)}.{method.name}",
+        func: method.func,
+    }
+    definition = _get_definition_arguments(parameters, namespace)
+    call = f"{func}({_get_trampoline_arguments(parameters, slot, namespace)})"
+    asynchronous = _is_coroutine_function(method.func)
+    awaited = f"await {call}" if asynchronous else call
+    trampoline = _Trampoline(method, slot, containers, returns, parameters, namespace)
+    body = trampoline.get_body(awaited, probe)
+    if body is None:
+        # Coroutine is returned as is, there is nothing to wrap in its result.
+        asynchronous = False
+        body = [f"return {call}"]
+    call_method = _compile("__call__", definition, body, namespace, asynchronous)
+    call_method.__annotations__ = _get_annotations(parameters[1:])
+    if returns is not _Empty:
+        call_method.__annotations__["return"] = returns
+    return call_method
+
+
+def _get_trampoline_arguments(parameters, slot, namespace):
+    get = _get_name("_get", parameters)
+    namespace[get] = slot.get
+    instance = f"{get}({parameters[0].name}.__self__)"
+    return ", ".join([instance, _get_call_arguments(parameters[1:])]).rstrip(", ")
+
+
+class _Trampoline:
+    def __init__(self, method, slot, containers, returns, parameters, namespace):
+        self.method = method
+        self.slot = slot
+        self.containers = containers
+        self.returns = returns
+        self.parameters = parameters
+        self.namespace = namespace
+
+    def get_body(self, call, probe):
+        stream = _get_stream(self.method.func)
+        if probe is not None:
+            return self.get_instrumented_body(call, probe)
+        elif stream is not None:
+            return self.get_stream_body(call, stream)
+        elif self.containers and self.returns is not None:
+            rewrap = self.define("_rewrap", self.get_rewrap())
+            return [f"return {rewrap}({call})"]
+        elif _returns_instances(self.method.cls, self.returns):
+            return self.get_wrap_body(call)
+
+    def get_instrumented_body(self, call, probe):
+        # Coroutines are awaited to measure the whole call.
+        observe = self.define("_observe", probe.observe)
+        name = self.define("_name", self.method.name)
+        wrap = self.define("_wrap", self.get_instrumented_wrap())
+        result, observed = self.get_names("result", "observed")
+        return [
+            f"with {observe}({name}) as {observed}:",
+            f"    {result} = {call}",
+            f"return {observed}.done({wrap}({result}), {result})",
+        ]
+
+    def get_stream_body(self, call, stream):
+        # Items are wrapped one by one as the generator is consumed.
+        stream_name = self.define("_stream", stream)
+        wrap = self.define("_wrap", self.get_wrap())
+        return [f"return {stream_name}({call}, {wrap})"]
+
+    def get_wrap_body(self, call):
+        classes = self.define("_cls", self.method.classes)
+        wrap = self.define("_wrap", self.slot.wrap)
+        [result] = self.get_names("result")
+        return [
+            f"{result} = {call}",
+            f"if type({result}) in {classes}:",
+            f"    {result} = {wrap}({result})",
+            f"return {result}",
+        ]
+
+    def get_instrumented_wrap(self):
+        stream = _get_stream(self.method.func)
+        if stream is not None:
+            wrap = self.get_wrap()
+            return lambda generator: stream(generator, wrap)
+        elif self.containers and self.returns is not None:
+            return self.get_rewrap()
+        elif _returns_instances(self.method.cls, self.returns):
+            return _define_wrap_function(self.method.classes, self.slot, False)
+        else:
+            return _keep
+
+    def get_wrap(self):
+        return _define_wrap_function(self.method.classes, self.slot, self.containers)
+
+    def get_rewrap(self):
+        return _define_rewrap_function(self.method.classes, self.slot)
+
+    def define(self, name, value):
+        [name] = self.get_names(name)
+        self.namespace[name] = value
+        return name
+
+    def get_names(self, *names):
+        return [_get_name(name, self.parameters) for name in names]
+
+
+def _keep(result):
+    return result
+
+
+def _get_method_signature(func):
+    try:
+        parameters, returns = _get_signature(func, follow_wrapped=False)
+    except (TypeError, ValueError):
+        return _generic_parameters, _Empty
+    if parameters and parameters[0].kind in _positional:
+        return parameters, returns
+    else:
+        return _generic_parameters, _Empty
+
+
+def _get_stream(func):
+    if _is_generator_function(func):
+        return _Stream
+    elif _is_async_generator_function(func):
+        return _AsyncStream
+
+
+def _returns_instances(cls, annotation):
+    # Only instances of the exact origin class are wrapped.  Origin class has
+    # no base classes, so any other concrete class annotation excludes it.
+    if annotation is None:
+        return False
+    elif isinstance(annotation, type) and annotation is not _Empty:
+        return issubclass(cls, annotation)
+    else:
+        return True
+
+
+_positional = {_POSITIONAL_ONLY, _POSITIONAL_OR_KEYWORD}
+
+
+_generic_parameters = [
+    _Parameter("self", _POSITIONAL_ONLY),
+    _Parameter("args", _VAR_POSITIONAL),
+    _Parameter("kwargs", _VAR_KEYWORD),
+]
+
+
+def _define_getattr_instance_method(func, slots):
+    slot = slots["_instance"]
+
+    def __getattr__(wrapper, name):
+        return func(slot.get(wrapper), name)
+
+    return __getattr__
+
+
+def _define_cached_getattr_instance_method(size, func, slots):
+    slot = slots["_instance"]
+    cache_slot = slots["_delegates"]
+
+    def __getattr__(wrapper, name):
+        try:
+            cache = cache_slot.get(wrapper)
+        except AttributeError:
+            cache = {}
+            cache_slot.set(wrapper, cache)
+        try:
+            return cache[name]
+        except KeyError:
+            pass
+        if len(cache) >= size:
+            _evict(cache)
+        cache[name] = bound_method = func(slot.get(wrapper), name)
+        return bound_method
+
+    def invalidate(wrapper):
+        cache_slot.set(wrapper, {})
+
+    __getattr__.invalidate = invalidate
+    return __getattr__
+
+
+def _define_wrap_function(classes, slot, containers):
+    if containers:
+        return _define_rewrap_function(classes, slot)
+
+    def wrap(result):
+        if type(result) in classes:
+            result = slot.wrap(result)
+        return result
+
+    return wrap
+
+
+def _define_eq_instance_method(slot):
+    get = slot.get
+    private_class = slot.private_class
+
+    def __eq__(wrapper, other):
+        if type(other) is not private_class:
+            return NotImplemented
+        return get(wrapper) == get(other)
+
+    return __eq__
+
+
+def _define_hash_instance_method(slots):
+    get = slots["_instance"].get
+    hash_slot = slots.get("_hash")
+    if hash_slot is None:
+
+        def __hash__(wrapper):
+            return hash(get(wrapper))
+
+    else:
+        # Encapsulated instance of the frozen class could not change its hash.
+        get_hash = hash_slot.get
+        set_hash = hash_slot.set
+
+        def __hash__(wrapper):
+            try:
+                return get_hash(wrapper)
+            except AttributeError:
+                value = hash(get(wrapper))
+                set_hash(wrapper, value)
+                return value
+
+    return __hash__
+
+
+def _define_repr_instance_method(slot):
+    def method(wrapper):
+        return f"Private::{slot.get(wrapper)!r}"
 
     return method
 
 
-def _wrap(instance, methods):
-    class_name = _get_class_name(instance.__class__)
-    defined = _define_instance_methods(instance, methods)
-    defined["__repr__"] = _define_repr_instance_method(instance)
-    return _PrivateType(class_name, (), defined)()
+def _define_reduce_instance_method(cls, slot):
+    def method(wrapper, protocol):
+        return _reduce_instance(cls, slot.private_class, slot.get(wrapper), protocol)
+
+    return method
 
 
 def _get_class_name(cls):
@@ -139,6 +525,43 @@ class _PrivateType(type):
         return cls.__name__
 
 
+pickle(_PrivateType, _reduce_private_class)
+
+
+class _Slot:
+    def __init__(self, private_class, name):
+        # Slot storage stays in the instance layout after the descriptor is
+        # removed from the class.  Only this object could reach it.
+        descriptor = private_class.__dict__[name]
+        delattr(private_class, name)
+        self.private_class = private_class
+        self.get = descriptor.__get__
+        self.set = descriptor.__set__
+
+    def freeze(self, cls, frozen_class):
+        # Origin instances are frozen before they are encapsulated.  The
+        # class is assigned past `__setattr__` of frozen dataclasses.
+        store = self.set
+
+        def freeze_and_store(wrapper, instance):
+            if type(instance) is cls:
+                object.__setattr__(instance, "__class__", frozen_class)
+            store(wrapper, instance)
+
+        self.set = freeze_and_store
+
+    def intern(self):
+        # Instances wrapped past the constructor are interned as well.
+        interned = _Interned(self.wrap)
+        self.wrap = interned.wrap
+        return interned
+
+    def wrap(self, instance):
+        wrapper = object.__new__(self.private_class)
+        self.set(wrapper, instance)
+        return wrapper
+
+
 def _get_method(cls, name, attribute):
     if not _is_dunder(name):
         return _get_method_1(cls, name, attribute)
@@ -149,6 +572,7 @@ def _get_method_1(cls, name, attribute):
         _deny_static_method(attribute)
         or _deny_class_method(attribute)
         or _get_delegate_method(cls, name, attribute)
+        or _get_memoized_method(cls, name, attribute)
         or _get_instance_method(cls, name, attribute)
         or _deny_class_attribute(attribute)
     )
@@ -168,7 +592,12 @@ def _deny_class_method(attribute):
 
 def _get_delegate_method(cls, name, attribute):
     if isinstance(attribute, Delegate):
-        return _DelegateMethod(cls, "__getattr__", _dynamic(attribute.f))
+        return _DelegateMethod(cls, "__getattr__", attribute)
+
+
+def _get_memoized_method(cls, name, attribute):
+    if isinstance(attribute, Memoize):
+        return _MemoizedMethod(cls, name, attribute)
 
 
 def _get_instance_method(cls, name, attribute):
@@ -186,16 +615,29 @@ def _is_dunder(name):
 
 
 class _Method:
+    slots = ()
+
     def __init__(self, cls, name, func):
         self.cls = cls
+        self.classes = (cls,)
         self.name = name
         self.func = func
 
     def is_underscore(self):
         return self.name.startswith("_")
 
-    def to_class(self, methods):
+    def to_class(self, slots, containers):
+        slot = slots["_instance"]
+        instance_method = self.to_instance(slot, containers)
+
         class Method:
+            def __get__(_, wrapper, owner):
+                if wrapper is None:
+                    return _
+                bound = object.__new__(instance_method)
+                bound.__self__ = wrapper
+                return bound
+
             def __call__(_, *args, **kwargs):
                 message = "Instance methods can not be called on classes"
                 raise GenericClassError(message)
@@ -205,20 +647,82 @@ class _Method:
 
         return Method()
 
-    def to_instance(self, instance, methods):
+    def to_instance(self, slot, containers):
         class Method:
-            def __call__(_, *args, **kwargs):
-                result = self.func(instance, *args, **kwargs)
-                if type(result) is self.cls:
-                    result = _wrap(result, methods)
-                return result
+            __slots__ = ("__self__",)
+
+            __call__ = self.to_call(slot, containers)
 
             def __repr__(_):
-                return f"Private::{instance!r}.{self.name}"
+                return f"Private::{slot.get(_.__self__)!r}.{self.name}"
 
-        return Method()
+        Method.__call__._instrument = lambda probe: self.to_call(
+            slot, containers, probe
+        )
+        _register_instrumented(Method, "__call__", _get_class_name(self.cls))
+        return Method
+
+    def to_call(self, slot, containers, probe=None):
+        return _define_call_instance_method(self, slot, containers, probe)
+
+
+class _MemoizedMethod(_Method):
+    slots = ("_memoized",)
+
+    def __init__(self, cls, name, memoize):
+        super().__init__(cls, name, memoize.f)
+        self.size = memoize.size
+        self.cache_slot = None
+
+    def to_class(self, slots, containers):
+        self.cache_slot = slots["_memoized"]
+        method = super().to_class(slots, containers)
+        method.invalidate = _define_invalidate_function(self.cache_slot)
+        return method
+
+    def to_call(self, slot, containers, probe=None):
+        call = super().to_call(slot, containers, probe)
+        parameters, _ = _get_method_signature(self.func)
+        if len(parameters) == 1:
+            return _memoized(self.name, call, self.cache_slot)
+        else:
+            return _memoized_arguments(self.name, call, self.cache_slot, self.size)
 
 
 class _DelegateMethod(_Method):
+    def __init__(self, cls, name, delegate):
+        super().__init__(cls, name, delegate.f)
+        self.delegate = delegate
+        self.cache = delegate.cache
+        self.slots = ("_delegates",) if delegate.cache else ()
+
     def is_underscore(self):
         return False
+
+    def to_class(self, slots, containers):
+        func = self.to_dispatch(slots["_instance"], containers)
+        if self.cache:
+            method = _define_cached_getattr_instance_method(self.cache, func, slots)
+        else:
+            method = _define_getattr_instance_method(func, slots)
+        if self.delegate.batch is None:
+            method._instrument = lambda probe: self.to_instrumented_class(
+                slots, containers, probe, method
+            )
+        return method
+
+    def to_instrumented_class(self, slots, containers, probe, method):
+        # Dispatched methods are not cached while hooks are active, so cache
+        # of the bare method never holds instrumented methods.
+        func = self.to_dispatch(slots["_instance"], containers, probe)
+        instrumented = _define_getattr_instance_method(func, slots)
+        if self.cache:
+            instrumented.invalidate = method.invalidate
+        return instrumented
+
+    def to_dispatch(self, slot, containers, probe=None):
+        wrap = _define_wrap_function(self.classes, slot, containers)
+        if self.delegate.batch is None:
+            return _dynamic(self.delegate.f, wrap, probe)
+        else:
+            return _batched(self.delegate.f, self.delegate.batch, wrap)
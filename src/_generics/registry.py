@@ -0,0 +1,26 @@
+from weakref import ref
+from weakref import WeakKeyDictionary
+from weakref import WeakValueDictionary
+
+from _generics.exceptions import GenericClassError
+
+
+def _register(cls, slot):
+    # Slot lives as long as methods of the private class refer to it.  Weak
+    # references keep both registries from holding decorated classes alive.
+    _registry[cls] = slot
+    _private_classes[slot.private_class] = cls, ref(slot)
+
+
+def _get_origin(private_class):
+    try:
+        cls, slot = _private_classes[private_class]
+    except (KeyError, TypeError):
+        raise GenericClassError("Class should be decorated with @private") from None
+    return cls, slot()
+
+
+_registry = WeakValueDictionary()
+
+
+_private_classes = WeakKeyDictionary()
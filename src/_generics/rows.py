@@ -0,0 +1,8 @@
+from collections.abc import Mapping
+
+
+def _is_keywords(row):
+    # Mappings are keyword arguments, any other sequence like a tuple, a list
+    # or a named tuple of database cursor is positional arguments.  Plain
+    # tuples skip the abstract class check.
+    return type(row) is not tuple and isinstance(row, Mapping)
@@ -0,0 +1,75 @@
+from sys import modules
+
+from _generics.exceptions import GenericClassError
+from _generics.registry import _get_origin
+from _generics.registry import _private_classes
+from _generics.registry import _registry
+
+
+def _reduce_private_class(private_class):
+    cls, _ = _get_origin(private_class)
+    return _find_private_class, (cls.__module__, cls.__qualname__)
+
+
+def _find_private_class(module_name, qualname):
+    try:
+        found = _import(module_name, qualname)
+    except (ImportError, AttributeError):
+        # Classes decorated in this process are found even if they are not
+        # reachable by name, for example in the interactive session.
+        found = _find_registered(module_name, qualname)
+    if found in _private_classes:
+        return found
+    try:
+        # Origin class is reachable by name if it was decorated by a call.
+        return _registry[found].private_class
+    except (KeyError, TypeError):
+        raise GenericClassError(f"Can not find private class {qualname!r}") from None
+
+
+def _import(module_name, qualname):
+    found = modules.get(module_name)
+    if found is None:
+        from importlib import import_module
+
+        found = import_module(module_name)
+    for name in qualname.split("."):
+        found = getattr(found, name)
+    return found
+
+
+def _find_registered(module_name, qualname):
+    for cls in list(_registry):
+        if cls.__module__ == module_name and cls.__qualname__ == qualname:
+            return cls
+
+
+def _reduce_instance(cls, private_class, instance, protocol):
+    func, args, *rest = instance.__reduce_ex__(protocol)
+    args = tuple(private_class if arg is cls else arg for arg in args)
+    return _restore, (private_class, func, args, *rest[:1])
+
+
+def _restore(private_class, func, args, state=None):
+    # State is applied the same way pickle does it.  Constructor is not
+    # called, so validation of the origin class is skipped.
+    cls, slot = _get_origin(private_class)
+    instance = func(*[cls if arg is private_class else arg for arg in args])
+    if state is not None:
+        _set_state(instance, state)
+    return slot.wrap(instance)
+
+
+def _set_state(instance, state):
+    setstate = getattr(instance, "__setstate__", None)
+    if setstate is not None:
+        setstate(state)
+        return
+    slot_state = None
+    if type(state) is tuple and len(state) == 2:
+        state, slot_state = state
+    if state:
+        instance.__dict__.update(state)
+    if slot_state:
+        for name, value in slot_state.items():
+            setattr(instance, name, value)
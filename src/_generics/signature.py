@@ -0,0 +1,129 @@
+from types import FunctionType
+
+
+_POSITIONAL_ONLY = 0
+_POSITIONAL_OR_KEYWORD = 1
+_VAR_POSITIONAL = 2
+_KEYWORD_ONLY = 3
+_VAR_KEYWORD = 4
+
+
+_CO_VARARGS = 0x04
+_CO_VARKEYWORDS = 0x08
+_CO_GENERATOR = 0x20
+_CO_COROUTINE = 0x80
+_CO_ASYNC_GENERATOR = 0x200
+
+
+class _Empty:
+    pass
+
+
+class _Parameter:
+    __slots__ = ("name", "kind", "default", "annotation")
+
+    def __init__(self, name, kind, default=_Empty, annotation=_Empty):
+        self.name = name
+        self.kind = kind
+        self.default = default
+        self.annotation = annotation
+
+
+def _get_signature(func, follow_wrapped=True):
+    if _is_plain_function(func, follow_wrapped):
+        return _get_code_signature(func)
+    else:
+        return _get_inspect_signature(func, follow_wrapped)
+
+
+def _is_coroutine_function(func):
+    if type(func) is FunctionType:
+        return bool(func.__code__.co_flags & _CO_COROUTINE)
+    else:
+        from inspect import iscoroutinefunction
+
+        return iscoroutinefunction(func)
+
+
+def _is_generator_function(func):
+    if type(func) is FunctionType:
+        return bool(func.__code__.co_flags & _CO_GENERATOR)
+    else:
+        from inspect import isgeneratorfunction
+
+        return isgeneratorfunction(func)
+
+
+def _is_async_generator_function(func):
+    if type(func) is FunctionType:
+        return bool(func.__code__.co_flags & _CO_ASYNC_GENERATOR)
+    else:
+        from inspect import isasyncgenfunction
+
+        return isasyncgenfunction(func)
+
+
+def _is_plain_function(func, follow_wrapped):
+    return (
+        type(func) is FunctionType
+        and not hasattr(func, "__signature__")
+        and not (follow_wrapped and hasattr(func, "__wrapped__"))
+    )
+
+
+def _get_code_signature(func):
+    code = func.__code__
+    names = code.co_varnames
+    positional = code.co_argcount
+    keyword = positional + code.co_kwonlyargcount
+    positional_defaults = func.__defaults__ or ()
+    first_default = positional - len(positional_defaults)
+    defaults = dict(zip(names[first_default:positional], positional_defaults))
+    defaults.update(func.__kwdefaults__ or {})
+    annotations = func.__annotations__
+    kinds = [
+        _POSITIONAL_ONLY if index < code.co_posonlyargcount else _POSITIONAL_OR_KEYWORD
+        for index in range(positional)
+    ]
+    order = list(names[:positional])
+    rest = keyword
+    if code.co_flags & _CO_VARARGS:
+        order.append(names[rest])
+        kinds.append(_VAR_POSITIONAL)
+        rest += 1
+    order.extend(names[positional:keyword])
+    kinds.extend([_KEYWORD_ONLY] * code.co_kwonlyargcount)
+    if code.co_flags & _CO_VARKEYWORDS:
+        order.append(names[rest])
+        kinds.append(_VAR_KEYWORD)
+    parameters = [
+        _Parameter(
+            name,
+            kind,
+            defaults.get(name, _Empty),
+            annotations.get(name, _Empty),
+        )
+        for name, kind in zip(order, kinds)
+    ]
+    return parameters, annotations.get("return", _Empty)
+
+
+def _get_inspect_signature(func, follow_wrapped):
+    from inspect import signature
+
+    func_signature = signature(func, follow_wrapped=follow_wrapped)
+    parameters = [
+        _Parameter(
+            parameter.name,
+            int(parameter.kind),
+            _get_inspect_value(parameter.default, func_signature),
+            _get_inspect_value(parameter.annotation, func_signature),
+        )
+        for parameter in func_signature.parameters.values()
+    ]
+    returns = _get_inspect_value(func_signature.return_annotation, func_signature)
+    return parameters, returns
+
+
+def _get_inspect_value(value, func_signature):
+    return _Empty if value is func_signature.empty else value
@@ -1,6 +1,23 @@
 """A classy toolkit designed with OOP in mind."""
+from _generics.build import build_many
+from _generics.columns import columnar
 from _generics.delegate import delegate
+from _generics.delegate import invalidate
+from _generics.evolve import evolve
+from _generics.instrument import instrument
+from _generics.memoize import memoize
+from _generics.parallel import parallel_map
 from _generics.private import private
 
 
-__all__ = ("private", "delegate")
+__all__ = (
+    "private",
+    "delegate",
+    "memoize",
+    "invalidate",
+    "build_many",
+    "columnar",
+    "parallel_map",
+    "evolve",
+    "instrument",
+)
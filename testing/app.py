@@ -1,4 +1,19 @@
+from generics import private
+
+
 class Entity:
     """A base class to prove implementation inheritance is a bad thing."""
 
     pass
+
+
+@private
+class Invoice:
+    """Invoice decorated at the module level to be found by worker processes."""
+
+    def __init__(self, total):
+        self.total = total
+
+    def describe(self):
+        """Describe the invoice."""
+        return f"Invoice for {self.total}"
@@ -0,0 +1,57 @@
+import tracemalloc
+from timeit import Timer
+
+
+def _flavours():
+    import examples.definitions
+    import examples.attrs
+    import examples.attrs_define
+    import examples.dataclasses
+    import examples.pydantic
+
+    yield "definitions", examples.definitions
+    yield "attrs", examples.attrs
+    yield "attrs_define", examples.attrs_define
+    yield "dataclass", examples.dataclasses
+    yield "pydantic", examples.pydantic
+
+
+def _compare(name, flavour, subject, baseline, repeat):
+    private = _measure(subject, repeat)
+    origin = _measure(baseline, repeat)
+    return {
+        "benchmark": name,
+        "flavour": flavour,
+        "private": private,
+        "baseline": origin,
+        "overhead": private / origin,
+        "unit": "seconds",
+    }
+
+
+def _compare_allocations(name, flavour, subject, baseline):
+    return {
+        "benchmark": name,
+        "flavour": flavour,
+        "private": _allocated(subject),
+        "baseline": _allocated(baseline),
+        "unit": "bytes",
+    }
+
+
+def _measure(func, repeat):
+    timer = Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _allocated(func, number=1000):
+    results = [None] * number
+    tracemalloc.start()
+    try:
+        for index in range(number):
+            results[index] = func()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return allocated / number
@@ -0,0 +1,62 @@
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+
+import benchmarks.build
+import benchmarks.columns
+import benchmarks.containers
+import benchmarks.delegate
+import benchmarks.equality
+import benchmarks.fields
+import benchmarks.instrument
+import benchmarks.intern
+import benchmarks.memoize
+import benchmarks.parallel
+import benchmarks.private
+import benchmarks.startup
+import benchmarks.threads
+from benchmarks import _flavours
+
+
+def _main():
+    arguments = _parser().parse_args()
+    report = {
+        "python": {
+            "implementation": platform.python_implementation(),
+            "version": platform.python_version(),
+            "gil": getattr(sys, "_is_gil_enabled", lambda: True)(),
+        },
+        "results": list(_results(arguments.repeat)),
+    }
+    with open(arguments.output, "w") as output:
+        json.dump(report, output, indent=2)
+        output.write("\n")
+
+
+def _parser():
+    parser = ArgumentParser(prog="benchmarks")
+    parser.add_argument("--output", default="/dev/stdout")
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser
+
+
+def _results(repeat):
+    yield from benchmarks.startup._benchmarks(repeat)
+    yield from benchmarks.containers._benchmarks(repeat)
+    yield from benchmarks.build._benchmarks(repeat)
+    yield from benchmarks.columns._benchmarks(repeat)
+    yield from benchmarks.parallel._benchmarks(repeat)
+    yield from benchmarks.intern._benchmarks(repeat)
+    yield from benchmarks.instrument._benchmarks(repeat)
+    yield from benchmarks.threads._benchmarks(repeat)
+    yield from benchmarks.memoize._benchmarks(repeat)
+    for flavour, e in _flavours():
+        yield from benchmarks.fields._benchmarks(flavour, e, repeat)
+        yield from benchmarks.private._benchmarks(flavour, e, repeat)
+        yield from benchmarks.delegate._benchmarks(flavour, e, repeat)
+        yield from benchmarks.equality._benchmarks(flavour, e, repeat)
+
+
+if __name__ == "__main__":  # pragma: no branch
+    _main()
@@ -0,0 +1,20 @@
+import examples.definitions as e
+from benchmarks import _compare
+from generics import build_many
+from generics import private
+
+
+def _benchmarks(repeat):
+    yield _build_many(1_000_000, repeat)
+
+
+def _build_many(size, repeat):
+    user_class = private(e.NamedUser)
+    rows = [("Jeff",)] * size
+    return _compare(
+        f"build_many_{size}",
+        "definitions",
+        lambda: list(build_many(user_class, rows)),
+        lambda: [user_class(*row) for row in rows],
+        repeat,
+    )
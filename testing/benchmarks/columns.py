@@ -0,0 +1,36 @@
+import examples.definitions as e
+from benchmarks import _allocated
+from benchmarks import _compare
+from generics import columnar
+from generics import private
+
+
+def _benchmarks(repeat):
+    yield _memory(100_000)
+    yield _apply(100_000, repeat)
+
+
+def _memory(size):
+    user_class = private(e.NamedUser)
+    rows = [(f"User {number}",) for number in range(size)]
+    return {
+        "benchmark": f"columnar_memory_{size}",
+        "flavour": "definitions",
+        "private": _allocated(lambda: columnar(user_class, rows), number=1),
+        "baseline": _allocated(lambda: [user_class(*row) for row in rows], number=1),
+        "unit": "bytes",
+    }
+
+
+def _apply(size, repeat):
+    user_class = private(e.NamedUser)
+    rows = [(f"User {number}",) for number in range(size)]
+    users = columnar(user_class, rows)
+    instances = [user_class(*row) for row in rows]
+    return _compare(
+        f"columnar_apply_{size}",
+        "definitions",
+        lambda: users.apply("greet"),
+        lambda: [user.greet() for user in instances],
+        repeat,
+    )
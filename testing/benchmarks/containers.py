@@ -0,0 +1,44 @@
+import examples.definitions as e
+from _generics.registry import _get_origin
+from benchmarks import _compare
+from generics import private
+
+
+def _benchmarks(repeat):
+    for size in [10_000, 100_000, 1_000_000]:
+        yield _rewrap(size, repeat)
+        yield _pass_through(size, repeat)
+
+
+def _rewrap(size, repeat):
+    user_class = private(e.TeamUser, containers=True)
+    user = user_class(name="Jeff")
+    members = [e.TeamUser(name="Kate")] * size
+    return _compare(
+        f"container_rewrap_{size}",
+        "definitions",
+        lambda: user.members(members),
+        _wrap_loop(user_class, members),
+        repeat,
+    )
+
+
+def _pass_through(size, repeat):
+    user_class = private(e.TeamUser, containers=True)
+    user = user_class(name="Jeff")
+    members = ["Kate"] * size
+    return _compare(
+        f"container_pass_through_{size}",
+        "definitions",
+        lambda: user.members(members),
+        _wrap_loop(user_class, members),
+        repeat,
+    )
+
+
+def _wrap_loop(user_class, members):
+    # Baseline wraps the list by hand the way the method of a class decorated
+    # without `containers` would have to.
+    cls, slot = _get_origin(user_class)
+    wrap = slot.wrap
+    return lambda: [wrap(item) if type(item) is cls else item for item in members]
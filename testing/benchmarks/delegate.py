@@ -0,0 +1,60 @@
+from benchmarks import _compare
+from benchmarks import _compare_allocations
+from examples.delegates import CachedSmartUser
+from examples.delegates import SmartUser
+from generics import private
+
+
+def _benchmarks(flavour, e, repeat):
+    yield _dynamic_dispatch(flavour, e, repeat)
+    yield _cached_dynamic_dispatch(flavour, e, repeat)
+    yield _cached_dynamic_dispatch_allocations(flavour, e)
+
+
+def _dynamic_dispatch(flavour, e, repeat):
+    smart_user = SmartUser(private(e.NamedUser)(name="Jeff"))
+    origin = _SmartUser(e.NamedUser(name="Jeff"))
+    return _compare(
+        "dynamic_dispatch",
+        flavour,
+        lambda: smart_user.greet(),
+        lambda: origin.greet(),
+        repeat,
+    )
+
+
+def _cached_dynamic_dispatch(flavour, e, repeat):
+    smart_user = CachedSmartUser(private(e.NamedUser)(name="Jeff"))
+    origin = _SmartUser(e.NamedUser(name="Jeff"))
+    return _compare(
+        "cached_dynamic_dispatch",
+        flavour,
+        lambda: smart_user.greet(),
+        lambda: origin.greet(),
+        repeat,
+    )
+
+
+def _cached_dynamic_dispatch_allocations(flavour, e):
+    cached = CachedSmartUser(private(e.NamedUser)(name="Jeff"))
+    uncached = SmartUser(private(e.NamedUser)(name="Jeff"))
+    return _compare_allocations(
+        "cached_dynamic_dispatch_allocations",
+        flavour,
+        lambda: cached.greet,
+        lambda: uncached.greet,
+    )
+
+
+class _SmartUser:
+    def __init__(self, user):
+        self.user = user
+        self.called = False
+
+    def __getattr__(self, name):
+        def smart(*args, **kwargs):
+            self.called = True
+            method = getattr(self.user, name)
+            return method(*args, **kwargs)
+
+        return smart
@@ -0,0 +1,23 @@
+from benchmarks import _compare
+from generics import private
+
+
+def _benchmarks(flavour, e, repeat):
+    yield _set_lookup(flavour, e, repeat)
+
+
+def _set_lookup(flavour, e, repeat):
+    # Baseline looks up the key people unwrap from instances without equality.
+    user_class = private(e.TeamUser, frozen=True, eq=True)
+    names = [f"User {number}" for number in range(1000)]
+    users = {user_class(name=name) for name in names}
+    keys = {(name,) for name in names}
+    user = user_class(name="User 500")
+    key = ("User 500",)
+    return _compare(
+        "set_lookup",
+        flavour,
+        lambda: user in users,
+        lambda: key in keys,
+        repeat,
+    )
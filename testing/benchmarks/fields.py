@@ -0,0 +1,20 @@
+from inspect import signature
+
+from _generics.fields import _get_parameters
+from benchmarks import _compare
+
+
+def _benchmarks(flavour, e, repeat):
+    yield _fields(flavour, e, repeat)
+
+
+def _fields(flavour, e, repeat):
+    # Baseline reads the signature of the constructor with inspect module.
+    init = e.TeamUser.__dict__["__init__"]
+    return _compare(
+        "fields",
+        flavour,
+        lambda: _get_parameters(e.TeamUser),
+        lambda: signature(init),
+        repeat,
+    )
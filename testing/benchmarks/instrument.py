@@ -0,0 +1,31 @@
+import examples.definitions as e
+from benchmarks import _compare
+from generics import instrument
+from generics import private
+
+
+def _benchmarks(repeat):
+    yield _disabled(repeat)
+    yield _enabled(repeat)
+
+
+def _disabled(repeat):
+    user = private(e.NamedUser)(name="Jeff")
+    origin = e.NamedUser(name="Jeff")
+    instrument(on_return=_on_return).remove()
+    return _compare(
+        "instrument_disabled", "definitions", user.greet, origin.greet, repeat
+    )
+
+
+def _enabled(repeat):
+    user = private(e.NamedUser)(name="Jeff")
+    origin = e.NamedUser(name="Jeff")
+    with instrument(on_return=_on_return):
+        return _compare(
+            "instrument_enabled", "definitions", user.greet, origin.greet, repeat
+        )
+
+
+def _on_return(class_name, name, duration, rewrapped):
+    pass
@@ -0,0 +1,35 @@
+import examples.definitions as e
+from benchmarks import _allocated
+from benchmarks import _compare
+from generics import private
+
+
+def _benchmarks(repeat):
+    yield _memory(100_000)
+    yield _construct(repeat)
+
+
+def _memory(size):
+    user_class = private(e.NamedUser)
+    interned_class = private(e.NamedUser, frozen=True, intern=True)
+    rows = [(f"User {number % 100}",) for number in range(size)]
+    return {
+        "benchmark": f"intern_memory_{size}",
+        "flavour": "definitions",
+        "private": _allocated(lambda: [interned_class(*row) for row in rows], 1),
+        "baseline": _allocated(lambda: [user_class(*row) for row in rows], 1),
+        "unit": "bytes",
+    }
+
+
+def _construct(repeat):
+    user_class = private(e.NamedUser)
+    interned_class = private(e.NamedUser, frozen=True, intern=True)
+    user = interned_class("Jeff")  # noqa: F841
+    return _compare(
+        "intern_construct",
+        "definitions",
+        lambda: interned_class("Jeff"),
+        lambda: user_class("Jeff"),
+        repeat,
+    )
@@ -0,0 +1,34 @@
+from benchmarks import _compare
+from generics import memoize
+from generics import private
+
+
+class _User:
+    def __init__(self, name):
+        self.name = name
+
+    def greet(self):
+        return f"Hello, {self.name}"
+
+    @memoize
+    def memoized_greet(self):
+        return f"Hello, {self.name}"
+
+    def score(self, factor):
+        return sum(ord(letter) * factor for letter in self.name)
+
+    @memoize
+    def memoized_score(self, factor):
+        return sum(ord(letter) * factor for letter in self.name)
+
+
+def _benchmarks(repeat):
+    user = private(_User)(name="Jeff")
+    yield _compare("memoize", "definitions", user.memoized_greet, user.greet, repeat)
+    yield _compare(
+        "memoize_arguments",
+        "definitions",
+        lambda: user.memoized_score(3),
+        lambda: user.score(3),
+        repeat,
+    )
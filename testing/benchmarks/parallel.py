@@ -0,0 +1,28 @@
+from benchmarks import _compare
+from generics import parallel_map
+from generics import private
+
+
+def _benchmarks(repeat):
+    yield _parallel_map(100_000, repeat)
+
+
+def _parallel_map(size, repeat):
+    users = [_User(f"User {number}") for number in range(size)]
+    return _compare(
+        f"parallel_map_{size}",
+        "definitions",
+        lambda: list(parallel_map(users, "rename", "Kate", chunksize=10_000)),
+        lambda: [user.rename("Kate") for user in users],
+        repeat,
+    )
+
+
+@private
+class _User:
+    # Worker processes find the class by its name.
+    def __init__(self, name):
+        self.name = name
+
+    def rename(self, name):
+        return self.__class__(name)
@@ -0,0 +1,96 @@
+import pickle
+
+from benchmarks import _compare
+from generics import private
+
+
+def _benchmarks(flavour, e, repeat):
+    yield _decoration(flavour, e, repeat)
+    yield _construction(flavour, e, repeat)
+    yield _method_call(flavour, e, repeat)
+    yield _rewrap(flavour, e, repeat)
+    yield _stream(flavour, e, repeat)
+    yield _pickle(flavour, e, repeat)
+    yield _evolve(flavour, e, repeat)
+
+
+def _decoration(flavour, e, repeat):
+    namespace = {k: v for k, v in vars(e.NamedUser).items() if callable(v)}
+    return _compare(
+        "decoration",
+        flavour,
+        lambda: private(e.NamedUser),
+        lambda: type(e.NamedUser.__name__, (), namespace),
+        repeat,
+    )
+
+
+def _construction(flavour, e, repeat):
+    user_class = private(e.NamedUser)
+    return _compare(
+        "construction",
+        flavour,
+        lambda: user_class(name="Jeff"),
+        lambda: e.NamedUser(name="Jeff"),
+        repeat,
+    )
+
+
+def _method_call(flavour, e, repeat):
+    user = private(e.NamedUser)(name="Jeff")
+    origin = e.NamedUser(name="Jeff")
+    return _compare("method_call", flavour, user.greet, origin.greet, repeat)
+
+
+def _rewrap(flavour, e, repeat):
+    user = private(e.NamedUser)(name="Jeff")
+    origin = e.NamedUser(name="Jeff")
+    return _compare(
+        "rewrap",
+        flavour,
+        lambda: user.rename("Kate"),
+        lambda: origin.rename("Kate"),
+        repeat,
+    )
+
+
+def _stream(flavour, e, repeat):
+    user = private(e.TeamUser)(name="Jeff")
+    origin = e.TeamUser(name="Jeff")
+    return _compare(
+        "stream",
+        flavour,
+        lambda: _consume(user.stream("Kate"), 1000),
+        lambda: _consume(origin.stream("Kate"), 1000),
+        repeat,
+    )
+
+
+def _consume(stream, number):
+    next(stream)
+    for _ in range(number):
+        stream.send("Kate")
+
+
+def _pickle(flavour, e, repeat):
+    user = private(e.NamedUser)(name="Jeff")
+    origin = e.NamedUser(name="Jeff")
+    return _compare(
+        "pickle_round_trip",
+        flavour,
+        lambda: pickle.loads(pickle.dumps(user, protocol=5)),
+        lambda: pickle.loads(pickle.dumps(origin, protocol=5)),
+        repeat,
+    )
+
+
+def _evolve(flavour, e, repeat):
+    user = private(e.TeamUser)(name="Jeff")
+    constructed = private(e.NamedUser)(name="Jeff")
+    return _compare(
+        "evolve",
+        flavour,
+        lambda: user.rename("Kate"),
+        lambda: constructed.rename("Kate"),
+        repeat,
+    )
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+from timeit import default_timer
+
+from benchmarks import _compare
+
+
+def _benchmarks(repeat):
+    yield _module_decoration(repeat)
+    yield _import(repeat)
+
+
+def _module_decoration(repeat):
+    private_module = compile(_module(5000, "@private"), "<private>", "exec")
+    plain_module = compile(_module(5000, ""), "<plain>", "exec")
+    return _compare(
+        "module_decoration",
+        None,
+        lambda: exec(private_module, {}),
+        lambda: exec(plain_module, {}),
+        repeat,
+    )
+
+
+def _module(number, decorator):
+    lines = ["from generics import private"]
+    for index in range(number):
+        lines.extend(
+            [
+                decorator,
+                f"class User{index}:",
+                "    def __init__(self, name):",
+                "        self.name = name",
+                "    def greet(self):",
+                "        return self.name",
+                "    def rename(self, name):",
+                f"        return User{index}(name)",
+            ]
+        )
+    return "\n".join(lines)
+
+
+def _import(repeat):
+    private = min(_run("import generics") for _ in range(repeat))
+    origin = min(_run("pass") for _ in range(repeat))
+    return {
+        "benchmark": "import",
+        "flavour": None,
+        "private": private,
+        "baseline": origin,
+        "overhead": private / origin,
+        "unit": "seconds",
+    }
+
+
+def _run(statement):
+    start = default_timer()
+    subprocess.run([sys.executable, "-c", statement], check=True)
+    return default_timer() - start
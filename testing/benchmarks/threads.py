@@ -0,0 +1,60 @@
+from threading import Barrier
+from threading import Thread
+from time import perf_counter
+
+import examples.definitions as e
+from generics import private
+
+
+def _benchmarks(repeat):
+    user = private(e.NamedUser)(name="Jeff")
+    origin = e.NamedUser(name="Jeff")
+    single = None
+    for threads in [1, 2, 4, 8, 16, 32]:
+        private_rate = _throughput(user, threads, repeat)
+        origin_rate = _throughput(origin, threads, repeat)
+        if single is None:
+            single = private_rate
+        yield {
+            "benchmark": f"threads_{threads}",
+            "flavour": "definitions",
+            "private": private_rate,
+            "baseline": origin_rate,
+            "scaling": private_rate / single,
+            "unit": "calls per second",
+        }
+
+
+def _throughput(user, threads, repeat, calls=20_000):
+    return max(_run(user, threads, calls) for _ in range(repeat))
+
+
+def _run(user, threads, calls):
+    # Every thread calls methods of the same shared instance and checks the
+    # results, so races would fail the benchmark.
+    barrier = Barrier(threads + 1)
+    failures = []
+    workers = [
+        Thread(target=_stress, args=(user, barrier, calls, failures))
+        for _ in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = perf_counter()
+    barrier.wait()
+    duration = perf_counter() - start
+    for worker in workers:
+        worker.join()
+    if sum(failures):
+        raise RuntimeError(f"{sum(failures)} calls returned wrong results")
+    return threads * calls * 2 / duration
+
+
+def _stress(user, barrier, calls, failures):
+    barrier.wait()
+    passed = 0
+    for _ in range(calls):
+        passed += user.greet() == "Hello, Jeff" and user.rename("Kate") is not None
+    barrier.wait()
+    failures.append(calls - passed)
@@ -4,6 +4,8 @@ from attr import attrib
 from attr import attrs
 from attr import evolve
 
+import generics
+
 
 @attrs
 class User:
@@ -63,6 +65,59 @@ class NamedUser:
         return evolve(self, name=name)
 
 
+@attrs
+class AsyncNamedUser:
+    """User domain model."""
+
+    name = attrib()
+
+    async def greet(self):
+        """Say nice thing."""
+        return f"Hello, {self.name}"
+
+    async def rename(self, name):
+        """Change user name."""
+        return evolve(self, name=name)
+
+
+@attrs
+class TeamUser:
+    """User domain model."""
+
+    name = attrib()
+
+    def greet(self):
+        """Say nice thing."""
+        return f"Hello, {self.name}"
+
+    def split(self, names, container):
+        """Create users with given names."""
+        return container(evolve(self, name=name) for name in names)
+
+    def index(self, names):
+        """Create users with given names indexed by name."""
+        return {name: evolve(self, name=name) for name in names}
+
+    def rename(self, name):
+        """Change user name."""
+        return generics.evolve(self, name=name)
+
+    def members(self, members):
+        """Return team members."""
+        return members
+
+    def stream(self, name):
+        """Create users with names sent to the generator."""
+        while name:
+            name = yield evolve(self, name=name)
+        return "Done"
+
+    async def stream_async(self, name):
+        """Create users with names sent to the asynchronous generator."""
+        while name:
+            name = yield evolve(self, name=name)
+
+
 @attrs
 class InheritanceUser(User):
     """Inherit user domain model."""
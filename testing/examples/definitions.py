@@ -1,5 +1,7 @@
 from datetime import date
 
+import generics
+
 
 class User:
     """User domain model."""
@@ -62,6 +64,59 @@ class NamedUser:
         return self.__class__(name)
 
 
+class AsyncNamedUser:
+    """User domain model."""
+
+    def __init__(self, name):
+        self.name = name
+
+    async def greet(self):
+        """Say nice thing."""
+        return f"Hello, {self.name}"
+
+    async def rename(self, name):
+        """Change user name."""
+        return self.__class__(name)
+
+
+class TeamUser:
+    """User domain model."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def greet(self):
+        """Say nice thing."""
+        return f"Hello, {self.name}"
+
+    def split(self, names, container):
+        """Create users with given names."""
+        return container(self.__class__(name) for name in names)
+
+    def index(self, names):
+        """Create users with given names indexed by name."""
+        return {name: self.__class__(name) for name in names}
+
+    def rename(self, name):
+        """Change user name."""
+        return generics.evolve(self, name=name)
+
+    def members(self, members):
+        """Return team members."""
+        return members
+
+    def stream(self, name):
+        """Create users with names sent to the generator."""
+        while name:
+            name = yield self.__class__(name)
+        return "Done"
+
+    async def stream_async(self, name):
+        """Create users with names sent to the asynchronous generator."""
+        while name:
+            name = yield self.__class__(name)
+
+
 class InheritanceUser(User):
     """Inherit user domain model."""
 
@@ -20,3 +20,57 @@ class SmartUser:
         self.called = True
         method = getattr(self.user, name)
         return method(*args, **kwargs)
+
+
+@private
+class CachedSmartUser:
+    """User model decorator."""
+
+    def __init__(self, user):
+        self.user = user
+
+    def is_smart(self):
+        """Check user is smart."""
+        raise RuntimeError
+
+    @delegate(cache=2)
+    def smart(self, name, args, kwargs):
+        """Handle methods dynamically."""
+        method = getattr(self.user, name)
+        return method(*args, **kwargs)
+
+
+@private
+class BatchedRepository:
+    """Repository model decorator."""
+
+    def __init__(self, repository):
+        self.repository = repository
+
+    def is_batched(self):
+        """Check repository calls are batched."""
+        raise RuntimeError
+
+    @delegate(batch=0)
+    async def batch(self, name, calls):
+        """Handle methods dynamically in batches."""
+        method = getattr(self.repository, name)
+        return method([args for args, kwargs in calls])
+
+
+@private
+class AsyncSmartUser:
+    """User model decorator."""
+
+    def __init__(self, user):
+        self.user = user
+
+    def is_smart(self):
+        """Check user is smart."""
+        return True
+
+    @delegate
+    async def smart(self, name, args, kwargs):
+        """Handle coroutine methods dynamically."""
+        method = getattr(self.user, name)
+        return self.__class__(await method(*args, **kwargs))
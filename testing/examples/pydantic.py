@@ -3,6 +3,8 @@ from datetime import date
 
 from pydantic.dataclasses import dataclass
 
+import generics
+
 
 @dataclass
 class User:
@@ -62,6 +64,59 @@ class NamedUser:
         return replace(self, name=name)
 
 
+@dataclass
+class AsyncNamedUser:
+    """User domain model."""
+
+    name: str
+
+    async def greet(self):
+        """Say nice thing."""
+        return f"Hello, {self.name}"
+
+    async def rename(self, name):
+        """Change user name."""
+        return replace(self, name=name)
+
+
+@dataclass
+class TeamUser:
+    """User domain model."""
+
+    name: str
+
+    def greet(self):
+        """Say nice thing."""
+        return f"Hello, {self.name}"
+
+    def split(self, names, container):
+        """Create users with given names."""
+        return container(replace(self, name=name) for name in names)
+
+    def index(self, names):
+        """Create users with given names indexed by name."""
+        return {name: replace(self, name=name) for name in names}
+
+    def rename(self, name):
+        """Change user name."""
+        return generics.evolve(self, name=name)
+
+    def members(self, members):
+        """Return team members."""
+        return members
+
+    def stream(self, name):
+        """Create users with names sent to the generator."""
+        while name:
+            name = yield replace(self, name=name)
+        return "Done"
+
+    async def stream_async(self, name):
+        """Create users with names sent to the asynchronous generator."""
+        while name:
+            name = yield replace(self, name=name)
+
+
 @dataclass
 class InheritanceUser(User):
     """Inherit user domain model."""
@@ -0,0 +1,52 @@
+"""Tests related to the build_many function."""
+from collections import namedtuple
+from datetime import date
+from itertools import count
+from itertools import islice
+
+import pytest
+
+from generics import build_many
+from generics import private
+from generics.exceptions import GenericClassError
+
+
+def test_build_from_tuples(e):
+    """Rows of positional arguments should create private instances."""
+    user_class = private(e.NamedUser)
+    users = list(build_many(user_class, [("Kate",), ("Jeff",)]))
+    assert [type(user) for user in users] == [user_class, user_class]
+    assert [user.greet() for user in users] == ["Hello, Kate", "Hello, Jeff"]
+    assert not hasattr(users[0], "name")
+
+
+def test_build_from_sequences(e):
+    """Rows of named tuples and lists should be positional arguments."""
+    user_class = private(e.NamedUser)
+    row_class = namedtuple("Row", ["name"])
+    users = list(build_many(user_class, [row_class("Kate"), ["Jeff"]]))
+    assert [type(user) for user in users] == [user_class, user_class]
+    assert [user.greet() for user in users] == ["Hello, Kate", "Hello, Jeff"]
+
+
+def test_build_from_mappings(e):
+    """Rows of keyword arguments should create private instances."""
+    user_class = private(e.User)
+    users = list(build_many(user_class, [{"last_login": date(1999, 12, 31)}]))
+    assert type(users[0]) is user_class
+    assert not users[0].is_active()
+
+
+def test_build_lazily(e):
+    """Instances should be created while rows are consumed."""
+    user_class = private(e.NamedUser)
+    rows = ((f"User {number}",) for number in count())
+    users = list(islice(build_many(user_class, rows), 2))
+    assert [user.greet() for user in users] == ["Hello, User 0", "Hello, User 1"]
+
+
+def test_deny_not_private_class(e):
+    """Only classes decorated with @private could be built."""
+    with pytest.raises(GenericClassError) as exc_info:
+        build_many(e.NamedUser, [("Kate",)])
+    assert str(exc_info.value) == "Class should be decorated with @private"
@@ -0,0 +1,109 @@
+"""Tests related to the columnar function."""
+import tracemalloc
+from collections import namedtuple
+from datetime import date
+
+import pytest
+
+from generics import columnar
+from generics import private
+from generics.exceptions import GenericClassError
+from generics.exceptions import GenericInstanceError
+
+
+def test_create_instances_on_demand(e):
+    """Collection should create private instances when they are requested."""
+    user_class = private(e.NamedUser)
+    users = columnar(user_class, [("Kate",), {"name": "Jeff"}])
+    assert len(users) == 2
+    assert type(users[0]) is user_class
+    assert users[-1].greet() == "Hello, Jeff"
+    assert [user.greet() for user in users] == ["Hello, Kate", "Hello, Jeff"]
+
+
+def test_create_instances_from_sequences(e):
+    """Rows of named tuples and lists should be positional arguments."""
+    user_class = private(e.NamedUser)
+    row_class = namedtuple("Row", ["name"])
+    users = columnar(user_class, [row_class("Kate"), ["Jeff"]])
+    assert [user.greet() for user in users] == ["Hello, Kate", "Hello, Jeff"]
+
+
+def test_store_numbers(e):
+    """Numbers should be given back to instances as they were stored."""
+    user_class = private(e.NamedUser)
+    for names in [[1, 2], [1.5, 2.5], [2**64, 1], [1, 2.5]]:
+        users = columnar(user_class, [(name,) for name in names])
+        assert [user.greet() for user in users] == [f"Hello, {n}" for n in names]
+
+
+def test_apply_method(e):
+    """Method should be called on every instance of the collection."""
+    user_class = private(e.User)
+    users = columnar(user_class, [(date(1999, 12, 31),), (date.today(),)])
+    assert users.apply("is_active") == [False, True]
+
+
+def test_apply_method_return_class_instances(e):
+    """Instances returned from applied methods should be @private as well."""
+    user_class = private(e.NamedUser)
+    users = columnar(user_class, [("Kate",), ("Jeff",)]).apply("rename", "John")
+    assert [type(user) for user in users] == [user_class, user_class]
+    assert [user.greet() for user in users] == ["Hello, John", "Hello, John"]
+
+
+def test_deny_columns_access(e):
+    """Encapsulated attributes should not be reachable from the client code."""
+    user_class = private(e.NamedUser)
+    users = columnar(user_class, [("Kate",)])
+    assert not hasattr(users, "_state")
+    assert not hasattr(users, "__dict__")
+    assert repr(users) == "Columns(Private::NamedUser, 1)"
+
+
+def test_deny_unknown_method(e):
+    """Only public instance methods could be applied."""
+    user_class = private(e.NamedUser)
+    users = columnar(user_class, [("Kate",)])
+    for name in ["name", "__init__"]:
+        with pytest.raises(GenericInstanceError) as exc_info:
+            users.apply(name)
+        assert str(exc_info.value) == f"{name!r} is not a public instance method"
+
+
+def test_deny_invalid_rows(e):
+    """Rows should match encapsulated attributes of the class."""
+    user_class = private(e.NamedUser)
+    row_class = namedtuple("Row", ["name", "age"])
+    rows = [(), ("Kate", "Jeff"), ["Kate", 18], row_class("Kate", 18), {}]
+    for row in [*rows, {"name": "Kate", "age": 18}]:
+        with pytest.raises(GenericInstanceError) as exc_info:
+            columnar(user_class, [row])
+        assert str(exc_info.value) == "Row should match encapsulated attributes"
+
+
+def test_deny_not_private_class(e):
+    """Only classes decorated with @private could be stored."""
+    with pytest.raises(GenericClassError) as exc_info:
+        columnar(e.NamedUser, [("Kate",)])
+    assert str(exc_info.value) == "Class should be decorated with @private"
+
+
+def test_memory_allocation(e):
+    """Collection should cost less memory than a list of private instances."""
+    user_class = private(e.NamedUser)
+    rows = [(f"User {number}",) for number in range(1000)]
+    users = _allocated(lambda: columnar(user_class, rows))
+    instances = _allocated(lambda: [user_class(*row) for row in rows])
+    assert users < instances
+
+
+def _allocated(factory):
+    tracemalloc.start()
+    try:
+        result = factory()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return allocated
@@ -1,7 +1,14 @@
 """Tests related to the @delegated decorator."""
+import asyncio
 from datetime import date
 
+import pytest
+
+from generics import delegate
+from generics import invalidate
 from generics import private
+from generics.exceptions import GenericClassError
+from generics.exceptions import GenericInstanceError
 
 
 def test_define_instance_methods(e, w):
@@ -11,3 +18,202 @@ def test_define_instance_methods(e, w):
     smart_user = w.SmartUser(user)
     assert not smart_user.is_active()
     assert smart_user.was_called()
+
+
+def test_coroutine_delegate(e, w):
+    """Await coroutine delegates and protect returned instances."""
+    user_class = private(e.AsyncNamedUser)
+    user = user_class(name="John")
+    smart_user = w.AsyncSmartUser(user)
+    renamed = asyncio.run(smart_user.rename("Kate"))
+    assert renamed.is_smart()
+    assert asyncio.run(renamed.greet()).is_smart()
+    assert type(renamed) is w.AsyncSmartUser
+
+
+def test_cache_dispatched_methods(e, w):
+    """Reuse dispatched methods when cache is enabled."""
+    user_class = private(e.User)
+    user = user_class(last_login=date(1999, 12, 31))
+    smart_user = w.CachedSmartUser(user)
+    assert smart_user.is_active is smart_user.is_active
+    assert not smart_user.is_active()
+
+
+def test_limit_dispatched_methods_cache(e, w):
+    """Forget the oldest dispatched method when cache is full."""
+    user_class = private(e.User)
+    user = user_class(last_login=date(1999, 12, 31))
+    smart_user = w.CachedSmartUser(user)
+    is_active = smart_user.is_active
+    smart_user.foo
+    assert smart_user.is_active is is_active
+    smart_user.bar
+    assert smart_user.is_active is not is_active
+
+
+def test_invalidate_dispatched_methods_cache(e, w):
+    """Forget dispatched methods on demand."""
+    user_class = private(e.User)
+    user = user_class(last_login=date(1999, 12, 31))
+    smart_user = w.CachedSmartUser(user)
+    is_active = smart_user.is_active
+    invalidate(smart_user)
+    assert smart_user.is_active is not is_active
+
+
+def test_deny_invalidate_without_cache(e, w):
+    """Deny invalidation of instances which does not cache dispatched methods."""
+    user_class = private(e.User)
+    user = user_class(last_login=date(1999, 12, 31))
+    smart_user = w.SmartUser(user)
+    with pytest.raises(GenericInstanceError) as exc_info:
+        invalidate(smart_user)
+    assert str(exc_info.value) == "Instance does not cache delegated methods"
+
+
+@pytest.mark.parametrize("cache", [0, -1, 1.5, True])
+def test_deny_invalid_cache_size(cache):
+    """Deny cache size which is not a positive integer."""
+    with pytest.raises(GenericClassError) as exc_info:
+        delegate(cache=cache)
+    expected = "Delegate cache size should be a positive integer"
+    assert str(exc_info.value) == expected
+
+
+def test_batch_dispatched_methods(w):
+    """Pass calls dispatched within a batch window together."""
+    repository = _Repository()
+    batched = w.BatchedRepository(repository)
+
+    async def load():
+        return await asyncio.gather(batched.get(1), batched.get(2), batched.get(3))
+
+    assert asyncio.run(load()) == ["user 1", "user 2", "user 3"]
+    assert repository.batches == [[(1,), (2,), (3,)]]
+
+
+def test_batch_dispatched_methods_by_name(w):
+    """Pass calls of different methods in separate batches."""
+    repository = _Repository()
+    batched = w.BatchedRepository(repository)
+
+    async def load():
+        return await asyncio.gather(batched.get(1), batched.count(), batched.get(2))
+
+    assert asyncio.run(load()) == ["user 1", 1, "user 2"]
+    assert repository.batches == [[(1,), (2,)], [()]]
+
+
+def test_batch_dispatched_methods_error(w):
+    """Propagate batch errors to every call."""
+    repository = _Repository()
+    batched = w.BatchedRepository(repository)
+
+    async def load():
+        return await asyncio.gather(
+            batched.fail(1), batched.fail(2), return_exceptions=True
+        )
+
+    first, second = asyncio.run(load())
+    assert isinstance(first, RuntimeError)
+    assert first is second
+
+
+def test_batch_dispatched_methods_results(w):
+    """Require one result per dispatched call."""
+    repository = _Repository()
+    batched = w.BatchedRepository(repository)
+
+    async def load():
+        return await asyncio.gather(batched.lose(1), batched.lose(2))
+
+    with pytest.raises(GenericInstanceError) as exc_info:
+        asyncio.run(load())
+    expected = "Batch delegate should return one result per call"
+    assert str(exc_info.value) == expected
+
+
+def test_batch_dispatched_methods_cancel(w):
+    """Skip calls cancelled before the batch is resolved."""
+    repository = _Repository()
+    batched = w.BatchedRepository(repository)
+
+    async def load():
+        calls = [batched.get(1), batched.get(2), batched.fail(1), batched.fail(2)]
+        calls[0].cancel()
+        calls[2].cancel()
+        return await asyncio.gather(*calls[1::2], return_exceptions=True)
+
+    user, error = asyncio.run(load())
+    assert user == "user 2"
+    assert isinstance(error, RuntimeError)
+
+
+def test_batch_dispatched_methods_cancel_batch():
+    """Cancel waiting calls if the batch is cancelled."""
+
+    @private
+    class Repository:
+        def __init__(self, delay):
+            self.delay = delay
+
+        def is_batched(self):
+            raise RuntimeError
+
+        @delegate(batch=0)
+        async def batch(self, name, calls):
+            await asyncio.sleep(self.delay)
+            raise RuntimeError
+
+    repository = Repository(60)
+    calls = []
+
+    async def load():
+        calls.extend([repository.get(1), repository.get(2)])
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(calls[0], 0.01)
+
+    asyncio.run(load())
+    assert calls[0].cancelled()
+    assert calls[1].cancelled()
+
+
+def test_deny_sync_batch_delegate():
+    """Deny batch delegate which is not a coroutine function."""
+    with pytest.raises(GenericClassError) as exc_info:
+
+        @delegate(batch=0)
+        def batch(self, name, calls):
+            raise RuntimeError
+
+    expected = "Batch delegate should be a coroutine function"
+    assert str(exc_info.value) == expected
+
+
+@pytest.mark.parametrize("batch", [-1, "0"])
+def test_deny_invalid_batch_window(batch):
+    """Deny batch window which is not a non-negative number."""
+    with pytest.raises(GenericClassError) as exc_info:
+        delegate(batch=batch)
+    expected = "Delegate batch window should be a non-negative number"
+    assert str(exc_info.value) == expected
+
+
+class _Repository:
+    def __init__(self):
+        self.batches = []
+
+    def get(self, calls):
+        self.batches.append(calls)
+        return [f"user {user_id}" for user_id, in calls]
+
+    def count(self, calls):
+        self.batches.append(calls)
+        return [len(calls)]
+
+    def fail(self, calls):
+        raise RuntimeError
+
+    def lose(self, calls):
+        return []
@@ -0,0 +1,169 @@
+"""Tests related to value equality of private instances."""
+from dataclasses import dataclass
+from dataclasses import field
+
+import attr
+import pytest
+
+from generics import private
+
+
+def test_identity_equality_by_default(e):
+    """Private instances should be compared by identity by default."""
+    user_class = private(e.TeamUser)
+    user = user_class(name="Kate")
+    assert user == user
+    assert user != user_class(name="Kate")
+    assert hash(user) != hash(user_class(name="Kate"))
+
+
+def test_value_equality(e):
+    """Private instances should be compared by encapsulated instances."""
+    user_class = private(e.TeamUser, eq=True)
+    expected = e.TeamUser(name="Kate") == e.TeamUser(name="Kate")
+    assert (user_class(name="Kate") == user_class(name="Kate")) is expected
+    assert (user_class(name="Kate") != user_class(name="Kate")) is not expected
+    assert user_class(name="Kate") != user_class(name="Jeff")
+    assert user_class(name="Kate") != e.TeamUser(name="Kate")
+    assert user_class(name="Kate") != private(e.TeamUser, eq=True)(name="Kate")
+
+
+def test_value_hash():
+    """Private instances should be hashed by encapsulated instances."""
+
+    class Currency:
+        def __init__(self, code):
+            self.code = code
+
+        def __eq__(self, other):
+            return self.code == other.code
+
+        def __hash__(self):
+            return hash(self.code)
+
+        def convert(self, amount):
+            raise RuntimeError
+
+    currency_class = private(Currency, eq=True)
+    index = {currency_class("USD"): "dollar"}
+    assert index[currency_class("USD")] == "dollar"
+    assert hash(currency_class("USD")) == hash(Currency("USD"))
+    assert len({currency_class("USD"), currency_class("USD")}) == 1
+
+
+def test_unhashable_encapsulated_instance():
+    """Private instances should not be hashed if encapsulated one is not."""
+
+    class Currency:
+        def __init__(self, code):
+            self.code = code
+
+        def __eq__(self, other):
+            raise RuntimeError
+
+        def convert(self, amount):
+            raise RuntimeError
+
+    currency_class = private(Currency, eq=True)
+    with pytest.raises(TypeError):
+        hash(currency_class("USD"))
+
+
+def test_frozen_value_hash(e):
+    """Frozen private instances should be hashed once."""
+    user_class = private(e.TeamUser, frozen=True, eq=True)
+    users = {user_class(name="Kate"), user_class(name="Kate"), user_class("Jeff")}
+    expected = 2 if e.TeamUser(name="Kate") == e.TeamUser(name="Kate") else 3
+    assert len(users) == expected
+    user = user_class(name="Kate")
+    assert hash(user) == hash(user)
+
+
+def test_frozen_hash_is_cached():
+    """Hash of the frozen private instance should be computed once."""
+    calls = []
+
+    class Currency:
+        def __init__(self, code):
+            self.code = code
+
+        def __eq__(self, other):
+            raise RuntimeError
+
+        def __hash__(self):
+            calls.append(self.code)
+            return hash(self.code)
+
+        def convert(self, amount):
+            raise RuntimeError
+
+    currency = private(Currency, frozen=True, eq=True)("USD")
+    assert hash(currency) == hash(currency) == hash("USD")
+    assert calls == ["USD"]
+
+
+def test_frozen_unhashable_equality():
+    """Frozen classes with their own equality should not be hashed."""
+
+    class Currency:
+        def __init__(self, code):
+            self.code = code
+
+        def __eq__(self, other):
+            raise RuntimeError
+
+        def convert(self, amount):
+            raise RuntimeError
+
+    currency_class = private(Currency, frozen=True, eq=True)
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(currency_class("USD"))
+
+
+def test_frozen_hash_compared_fields():
+    """Frozen classes with generated equality should be hashed by compared fields."""
+
+    @dataclass
+    class Price:
+        amount: int
+        note: str = field(compare=False)
+
+        def show(self):
+            raise RuntimeError
+
+    @attr.s
+    class Currency:
+        code = attr.ib(eq=str.lower)
+        note = attr.ib(eq=False)
+
+        def convert(self, amount):
+            raise RuntimeError
+
+    price_class = private(Price, frozen=True, eq=True)
+    currency_class = private(Currency, frozen=True, eq=True)
+    assert len({price_class(1, "a"), price_class(1, "b")}) == 1
+    assert len({currency_class("USD", "a"), currency_class("usd", "b")}) == 1
+
+
+def test_reinitialization_keeps_value():
+    """Constructor called on the existing instance should not change its value."""
+
+    class Currency:
+        def __init__(self, code):
+            self.code = code
+
+        def __eq__(self, other):
+            return self.code == other.code
+
+        def __hash__(self):
+            return hash(self.code)
+
+        def convert(self, amount):
+            raise RuntimeError
+
+    currency_class = private(Currency, frozen=True, eq=True)
+    currency = currency_class("USD")
+    assert currency in {currency_class("USD")}
+    currency.__init__("EUR")
+    assert currency == currency_class("USD")
+    assert currency in {currency_class("USD")}
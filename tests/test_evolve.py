@@ -0,0 +1,111 @@
+"""Tests related to the evolve function."""
+import pytest
+
+from generics import evolve
+from generics import private
+from generics.exceptions import GenericClassError
+from generics.exceptions import GenericInstanceError
+
+
+def test_evolve_inside_method(e):
+    """Method should return private copy of the instance with changes."""
+    user_class = private(e.TeamUser)
+    user = user_class(name="Kate")
+    renamed = user.rename("Jeff")
+    assert type(renamed) is user_class
+    assert renamed.greet() == "Hello, Jeff"
+    assert user.greet() == "Hello, Kate"
+
+
+def test_evolve_with_containers(e):
+    """Evolved instances should not be wrapped twice."""
+    user_class = private(e.TeamUser, containers=True)
+    renamed = user_class(name="Kate").rename("Jeff")
+    assert type(renamed) is user_class
+    assert renamed.greet() == "Hello, Jeff"
+
+
+def test_deny_unknown_attribute():
+    """Only encapsulated attributes could be changed."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def greet(self):
+            return f"Hello, {self.name}"
+
+    private(User)
+    for name in ["age", "greet"]:
+        with pytest.raises(GenericInstanceError) as exc_info:
+            evolve(User("Kate"), **{name: "Jeff"})
+        assert str(exc_info.value) == f"{name!r} is not an encapsulated attribute"
+    assert evolve(User("Kate"), name="Jeff").greet() == "Hello, Jeff"
+    assert type(evolve(User("Kate"), name="Jeff")) is User
+
+
+def test_deny_computed_attribute():
+    """Attributes not given to the constructor could not be changed."""
+
+    class User:
+        def __init__(self, first_name):
+            self.name = first_name.title()
+
+        def greet(self):
+            raise RuntimeError
+
+    private(User)
+    with pytest.raises(GenericInstanceError) as exc_info:
+        evolve(User("kate"), name="Jeff")
+    assert str(exc_info.value) == "'name' is not an encapsulated attribute"
+
+
+def test_evolve_class_decorated_twice(e):
+    """Copy should be encapsulated by the class of the calling method."""
+    user_class = private(e.TeamUser)
+    other_class = private(e.TeamUser, eq=True)
+    renamed = user_class(name="Kate").rename("Jeff")
+    assert type(renamed) is user_class
+    assert type(other_class(name="Kate").rename("Jeff")) is other_class
+    assert renamed.greet() == "Hello, Jeff"
+
+
+def test_evolve_slots():
+    """Classes with slots should be copied without constructor call."""
+
+    class User:
+        __slots__ = ("name",)
+
+        def __init__(self, name):
+            self.name = name
+
+        def greet(self):
+            return f"Hello, {self.name}"
+
+    private(User)
+    user = User("Kate")
+    renamed = evolve(user, name="Jeff")
+    assert type(renamed) is User
+    assert renamed.greet() == "Hello, Jeff"
+    assert user.greet() == "Hello, Kate"
+
+
+def test_deny_private_instance(e):
+    """Private instances could not be changed from the client code."""
+    user_class = private(e.TeamUser)
+    with pytest.raises(GenericInstanceError) as exc_info:
+        evolve(user_class(name="Kate"), name="Jeff")
+    expected = "Evolve encapsulated instance inside its methods"
+    assert str(exc_info.value) == expected
+
+
+def test_deny_not_private_class():
+    """Instances of classes without @private decorator could not be evolved."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+    with pytest.raises(GenericClassError) as exc_info:
+        evolve(User("Kate"), name="Jeff")
+    assert str(exc_info.value) == "Class should be decorated with @private"
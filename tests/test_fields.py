@@ -0,0 +1,116 @@
+"""Tests related to constructor fields read from class metadata."""
+import sys
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import InitVar
+from typing import ClassVar
+
+import attr
+import pytest
+
+from generics import columnar
+from generics import private
+
+
+def test_attrs_private_attribute():
+    """Private attribute of attrs class is set with alias argument."""
+
+    @attr.s(frozen=True)
+    class User:
+        _name = attr.ib()
+
+        def greet(self):
+            return f"Hello, {self._name}"
+
+    user = private(User)(name="Alice")
+    assert user.greet() == "Hello, Alice"
+
+
+def test_attrs_keyword_only_and_factory():
+    """Keyword only attributes and factories of attrs class are respected."""
+
+    @attr.s(frozen=True)
+    class User:
+        name = attr.ib(kw_only=True)
+        tags = attr.ib(factory=list)
+
+        def greet(self):
+            return f"Hello, {self.name} {self.tags}"
+
+        def tag(self, tag):
+            self.tags.append(tag)
+
+    User = private(User)
+    first = User(name="Alice")
+    second = User(["admin"], name="Bob")
+    first.tag("user")
+    assert first.greet() == "Hello, Alice ['user']"
+    assert second.greet() == "Hello, Bob ['admin']"
+    with pytest.raises(TypeError):
+        User("Alice")
+
+
+def test_dataclass_skips_class_variables():
+    """Class variables and excluded fields of dataclass are not constructor fields."""
+
+    @dataclass
+    class User:
+        limit: ClassVar[int]
+        name: str
+        prefix: InitVar[str]
+        visits: int = field(init=False)
+
+        def __post_init__(self, prefix):
+            self.visits = len(prefix)
+
+        def greet(self):
+            return f"Hello, {self.name} {self.visits}"
+
+    user = private(User)("Alice", "Hi")
+    assert user.greet() == "Hello, Alice 2"
+    users = columnar(private(User), [("Bob", "Hey"), {"name": "Kate", "prefix": ""}])
+    assert [user.greet() for user in users] == ["Hello, Bob 3", "Hello, Kate 0"]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="Added in Python 3.10")
+def test_dataclass_keyword_only_and_factory():
+    """Keyword only fields and factories of dataclass are respected."""
+
+    @dataclass(kw_only=True)
+    class User:
+        name: str
+        tags: list = field(default_factory=list)
+
+        def greet(self):
+            return f"Hello, {self.name} {self.tags}"
+
+        def tag(self, tag):
+            self.tags.append(tag)
+
+    User = private(User)
+    first = User(name="Alice")
+    second = User(name="Bob", tags=["admin"])
+    first.tag("user")
+    assert first.greet() == "Hello, Alice ['user']"
+    assert second.greet() == "Hello, Bob ['admin']"
+    with pytest.raises(TypeError):
+        User("Alice")
+
+
+def test_custom_constructor():
+    """Custom constructor of dataclass is used instead of its fields."""
+
+    @dataclass(init=False)
+    class User:
+        name: str
+
+        def __init__(self, first, last):
+            self.name = f"{first} {last}"
+
+        def greet(self):
+            return f"Hello, {self.name}"
+
+    user = private(User)("Alice", "Smith")
+    assert user.greet() == "Hello, Alice Smith"
+    with pytest.raises(TypeError):
+        private(User)(name="Alice")
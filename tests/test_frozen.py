@@ -0,0 +1,248 @@
+"""Tests related to frozen and interned private classes."""
+import gc
+import pickle
+from dataclasses import dataclass
+from threading import Thread
+from weakref import ref
+
+import pytest
+
+from generics import build_many
+from generics import columnar
+from generics import evolve
+from generics import private
+from generics.exceptions import GenericClassError
+from generics.exceptions import GenericInstanceError
+
+
+def test_frozen_instance():
+    """Encapsulated instance of frozen class could not be changed."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def greet(self):
+            return f"Hello, {self.name}"
+
+        def rename(self, name):
+            self.name = name
+
+        def forget(self):
+            del self.name
+
+    user_class = private(User, frozen=True)
+    user = user_class("Kate")
+    with pytest.raises(GenericInstanceError) as exc_info:
+        user.rename("Jeff")
+    assert str(exc_info.value) == "Frozen instance could not be changed"
+    with pytest.raises(GenericInstanceError) as exc_info:
+        user.forget()
+    assert str(exc_info.value) == "Frozen instance could not be changed"
+    assert user.greet() == "Hello, Kate"
+
+
+def test_frozen_flavours(e):
+    """Frozen classes should work the same way regular private classes do."""
+    user_class = private(e.TeamUser, containers=True, frozen=True)
+    user = user_class(name="Kate")
+    assert user.greet() == "Hello, Kate"
+    renamed = user.rename("Jeff")
+    assert type(renamed) is user_class
+    assert renamed.greet() == "Hello, Jeff"
+    [split] = user.split(["Jeff"], list)
+    assert type(split) is user_class
+
+
+def test_frozen_copies():
+    """Instances created without constructor should be frozen as well."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def greet(self):
+            return f"Hello, {self.name}"
+
+        def rename(self, name):
+            self.name = name
+
+        def copy(self):
+            return evolve(self, name=self.name)
+
+    user_class = private(User, frozen=True)
+    [built] = build_many(user_class, [("Kate",)])
+    restored = pickle.loads(pickle.dumps(built))
+    stored = columnar(user_class, [("Kate",)])[0]
+    for user in [built, restored, stored, built.copy()]:
+        assert type(user) is user_class
+        assert user.greet() == "Hello, Kate"
+        with pytest.raises(GenericInstanceError):
+            user.rename("Jeff")
+
+
+def test_frozen_origin_instances():
+    """Instances of the origin class returned from methods should be frozen."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def greet(self):
+            return f"Hello, {self.name}"
+
+        def rename(self, name):
+            return User(name)
+
+        def change(self, name):
+            self.name = name
+
+    user_class = private(User, frozen=True)
+    renamed = user_class("Kate").rename("Jeff")
+    assert type(renamed) is user_class
+    assert renamed.greet() == "Hello, Jeff"
+    with pytest.raises(GenericInstanceError):
+        renamed.change("John")
+
+
+def test_frozen_dataclass():
+    """Classes denying attribute assignment should be frozen as well."""
+
+    @dataclass(frozen=True)
+    class User:
+        name: str
+
+        def greet(self):
+            return f"Hello, {self.name}"
+
+        def rename(self, name):
+            return User(name)
+
+    user_class = private(User, frozen=True)
+    user = user_class("Kate")
+    [built] = build_many(user_class, [("Jeff",)])
+    for renamed in [user.rename("Jeff"), built]:
+        assert type(renamed) is user_class
+        assert renamed.greet() == "Hello, Jeff"
+
+
+def test_interned_instance(e):
+    """Constructor should return the same instance for equal arguments."""
+    user_class = private(e.TeamUser, frozen=True, intern=True)
+    user = user_class("Kate")
+    assert user_class("Kate") is user
+    assert user_class(name="Kate") is user
+    assert user_class("Jeff") is not user
+    assert user.greet() == "Hello, Kate"
+
+
+def test_interned_argument_types():
+    """Equal arguments of different types should not return the same instance."""
+
+    class Number:
+        def __init__(self, value):
+            self.value = value
+
+        def show(self):
+            return repr(self.value)
+
+    number_class = private(Number, frozen=True, intern=True)
+    numbers = [number_class(1), number_class(1.0), number_class(True)]
+    assert [number.show() for number in numbers] == ["1", "1.0", "True"]
+    assert number_class(1) is numbers[0]
+
+
+def test_interned_copies():
+    """Instances created without constructor should be interned as well."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def greet(self):
+            raise RuntimeError
+
+        def same(self):
+            return User(self.name)
+
+        def copy(self):
+            return evolve(self, name=self.name)
+
+    user_class = private(User, frozen=True, intern=True)
+    user = user_class("Kate")
+    [built] = build_many(user_class, [("Kate",)])
+    restored = pickle.loads(pickle.dumps(user))
+    stored = columnar(user_class, [("Kate",)])[0]
+    for copied in [user.same(), user.copy(), built, restored, stored]:
+        assert copied is user
+
+
+def test_interned_slots():
+    """Instances with slots should be interned by their slots."""
+
+    class User:
+        __slots__ = "name"
+
+        def __init__(self, name):
+            self.name = name
+
+        def greet(self):
+            raise RuntimeError
+
+        def same(self):
+            return User(self.name)
+
+    user_class = private(User, frozen=True, intern=True)
+    user = user_class("Kate")
+    assert user.same() is user
+    assert user_class("Jeff").same() is not user
+
+
+def test_interned_unhashable_arguments():
+    """Instances created from unhashable arguments should not be interned."""
+
+    class Team:
+        def __init__(self, names):
+            self.names = names
+
+        def count(self):
+            return len(self.names)
+
+    team_class = private(Team, frozen=True, intern=True)
+    assert team_class(["Kate"]) is not team_class(["Kate"])
+    assert team_class(["Kate"]).count() == 1
+
+
+def test_interned_instances_are_released(e):
+    """Interned instances should be released when clients do not use them."""
+    user_class = private(e.TeamUser, frozen=True, intern=True)
+    user = user_class("Kate")
+    reference = ref(user)
+    del user
+    gc.collect()
+    assert reference() is None
+    assert user_class("Kate").greet() == "Hello, Kate"
+
+
+def test_interned_threads(e):
+    """Threads constructing equal instances should get the same instance."""
+    user_class = private(e.TeamUser, frozen=True, intern=True)
+    found = []
+
+    def construct():
+        found.extend(user_class("Kate") for _ in range(1000))
+
+    threads = [Thread(target=construct) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(found) == 8000
+    assert len(set(map(id, found))) == 1
+
+
+def test_deny_mutable_interned_class(e):
+    """Only frozen classes could be interned."""
+    with pytest.raises(GenericClassError) as exc_info:
+        private(e.TeamUser, intern=True)
+    assert str(exc_info.value) == "Interned class should be frozen"
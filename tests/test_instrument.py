@@ -0,0 +1,241 @@
+"""Tests related to the instrument function."""
+import asyncio
+from datetime import date
+
+import pytest
+
+from generics import delegate
+from generics import instrument
+from generics import invalidate
+from generics import memoize
+from generics import private
+
+
+class _Recorder:
+    def __init__(self):
+        self.events = []
+
+    def on_call(self, class_name, name):
+        self.events.append(("call", class_name, name))
+
+    def on_return(self, class_name, name, duration, rewrapped):
+        assert duration >= 0
+        self.events.append(("return", class_name, name, rewrapped))
+
+    def on_error(self, class_name, name, duration, error):
+        assert duration >= 0
+        self.events.append(("error", class_name, name, type(error)))
+
+    def instrument(self):
+        return instrument(self.on_call, self.on_return, self.on_error)
+
+
+def test_instrument_method(e):
+    """Hooks should be called around instance methods."""
+    recorder = _Recorder()
+    user = private(e.NamedUser)(name="Kate")
+    with recorder.instrument():
+        assert user.greet() == "Hello, Kate"
+        assert user.rename("Jeff").greet() == "Hello, Jeff"
+    assert recorder.events == [
+        ("call", "Private::NamedUser", "greet"),
+        ("return", "Private::NamedUser", "greet", False),
+        ("call", "Private::NamedUser", "rename"),
+        ("return", "Private::NamedUser", "rename", True),
+        ("call", "Private::NamedUser", "greet"),
+        ("return", "Private::NamedUser", "greet", False),
+    ]
+
+
+def test_instrument_coroutine_method(e):
+    """Hooks should be called when the coroutine is finished."""
+    recorder = _Recorder()
+    user = private(e.AsyncNamedUser)(name="Kate")
+    with recorder.instrument():
+        renamed = asyncio.run(user.rename("Jeff"))
+    assert asyncio.run(renamed.greet()) == "Hello, Jeff"
+    assert recorder.events == [
+        ("call", "Private::AsyncNamedUser", "rename"),
+        ("return", "Private::AsyncNamedUser", "rename", True),
+    ]
+
+
+def test_instrument_error():
+    """Hooks should be called when the method raise an error."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def fail(self):
+            raise ValueError(self.name)
+
+    recorder = _Recorder()
+    user = private(User)(name="Kate")
+    with recorder.instrument():
+        with pytest.raises(ValueError, match="Kate"):
+            user.fail()
+    assert recorder.events == [
+        ("call", "Private::User", "fail"),
+        ("error", "Private::User", "fail", ValueError),
+    ]
+
+
+def test_instrument_delegate_error():
+    """Hooks should be called when the dispatched method raise an error."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        @delegate
+        def fail(self, name, args, kwargs):
+            raise ValueError(self.name)
+
+    class AsyncUser:
+        def __init__(self, name):
+            self.name = name
+
+        @delegate
+        async def fail(self, name, args, kwargs):
+            raise ValueError(self.name)
+
+    recorder = _Recorder()
+    user = private(User)(name="Kate")
+    async_user = private(AsyncUser)(name="Jeff")
+    with recorder.instrument():
+        with pytest.raises(ValueError, match="Kate"):
+            user.greet()
+        with pytest.raises(ValueError, match="Jeff"):
+            asyncio.run(async_user.greet())
+    assert recorder.events == [
+        ("call", "Private::User", "greet"),
+        ("error", "Private::User", "greet", ValueError),
+        ("call", "Private::AsyncUser", "greet"),
+        ("error", "Private::AsyncUser", "greet", ValueError),
+    ]
+
+
+def test_instrument_method_results():
+    """Instrumented methods should wrap results the same way bare methods do."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def greet(self) -> str:
+            return f"Hello, {self.name}"
+
+        def split(self, names):
+            return [User(name) for name in names]
+
+    recorder = _Recorder()
+    user_class = private(User, containers=True)
+    user = user_class(name="Kate")
+    with recorder.instrument():
+        assert private(User)(name="Kate").greet() == "Hello, Kate"
+        [split] = user.split(["Jeff"])
+    assert type(split) is user_class
+    assert recorder.events == [
+        ("call", "Private::User", "greet"),
+        ("return", "Private::User", "greet", False),
+        ("call", "Private::User", "split"),
+        ("return", "Private::User", "split", True),
+    ]
+
+
+def test_instrument_delegate(e, w):
+    """Hooks should be called around dispatched methods."""
+    recorder = _Recorder()
+    user = private(e.User)(last_login=date(1999, 12, 31))
+    smart_user = w.CachedSmartUser(user)
+    is_active = smart_user.is_active
+    with recorder.instrument() as instrumentation:
+        assert not smart_user.is_active()
+        invalidate(smart_user)
+        instrumentation.remove()
+    assert smart_user.is_active is not is_active
+    assert recorder.events == [
+        ("call", "Private::CachedSmartUser", "is_active"),
+        ("call", "Private::User", "is_active"),
+        ("return", "Private::User", "is_active", False),
+        ("return", "Private::CachedSmartUser", "is_active", False),
+    ]
+
+
+def test_instrument_coroutine_delegate(e, w):
+    """Hooks should be called when dispatched coroutine is finished."""
+    recorder = _Recorder()
+    user = private(e.AsyncNamedUser)(name="John")
+    smart_user = w.AsyncSmartUser(user)
+    with recorder.instrument():
+        renamed = asyncio.run(smart_user.rename("Kate"))
+    assert type(renamed) is w.AsyncSmartUser
+    assert recorder.events == [
+        ("call", "Private::AsyncSmartUser", "rename"),
+        ("call", "Private::AsyncNamedUser", "rename"),
+        ("return", "Private::AsyncNamedUser", "rename", True),
+        ("return", "Private::AsyncSmartUser", "rename", True),
+    ]
+
+
+def test_remove_instrumentation(e):
+    """Bare methods should be restored when hooks are removed."""
+    recorder = _Recorder()
+    user_class = private(e.NamedUser)
+    user = user_class(name="Kate")
+    bare = type(user.greet).__call__
+    instrumentation = recorder.instrument()
+    assert type(user.greet).__call__ is not bare
+    instrumentation.remove()
+    instrumentation.remove()
+    assert type(user.greet).__call__ is bare
+    user.greet()
+    assert recorder.events == []
+
+
+def test_instrument_new_classes(e):
+    """Classes decorated while hooks are active should call them."""
+    recorder = _Recorder()
+    with recorder.instrument():
+        user = private(e.NamedUser)(name="Kate")
+        user.greet()
+    user.greet()
+    assert recorder.events == [
+        ("call", "Private::NamedUser", "greet"),
+        ("return", "Private::NamedUser", "greet", False),
+    ]
+
+
+def test_instrument_many(e):
+    """All active hooks should be called."""
+    first, second = _Recorder(), _Recorder()
+    user = private(e.NamedUser)(name="Kate")
+    with first.instrument():
+        with instrument(on_call=second.on_call):
+            user.greet()
+        user.greet()
+    assert len(first.events) == 4
+    assert second.events == [("call", "Private::NamedUser", "greet")]
+
+
+def test_instrument_memoized_method():
+    """Hooks should be called when memoized method is computed."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        @memoize
+        def greet(self):
+            return f"Hello, {self.name}"
+
+    recorder = _Recorder()
+    user = private(User)(name="Kate")
+    with recorder.instrument():
+        user.greet()
+        user.greet()
+    assert recorder.events == [
+        ("call", "Private::User", "greet"),
+        ("return", "Private::User", "greet", False),
+    ]
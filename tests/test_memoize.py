@@ -0,0 +1,183 @@
+"""Tests related to the memoize decorator."""
+from inspect import signature
+
+import pytest
+
+from generics import invalidate
+from generics import memoize
+from generics import private
+from generics.exceptions import GenericClassError
+
+
+class _Counter:
+    def __init__(self, name):
+        self.name = name
+        self.calls = []
+
+    @memoize
+    def greet(self):
+        self.calls.append("greet")
+        return f"Hello, {self.name}"
+
+    @memoize(size=2)
+    def greet_many(self, greeting, punctuation="!"):
+        self.calls.append(greeting)
+        return f"{greeting}, {self.name}{punctuation}"
+
+    def count(self):
+        return len(self.calls)
+
+    def polite(self):
+        return self.greet()
+
+
+def test_memoize_method_without_arguments():
+    """Method without arguments should be called once per instance."""
+    counter_class = private(_Counter)
+    counter = counter_class("Kate")
+    assert counter.greet() == "Hello, Kate"
+    assert counter.greet() == "Hello, Kate"
+    assert counter.count() == 1
+    other = counter_class("Jeff")
+    assert other.greet() == "Hello, Jeff"
+    assert other.count() == 1
+
+
+def test_memoize_method_with_arguments():
+    """Recently used arguments should be kept up to the cache size."""
+    counter_class = private(_Counter)
+    counter = counter_class("Kate")
+    assert counter.greet_many("Hi") == "Hi, Kate!"
+    assert counter.greet_many("Hi") == "Hi, Kate!"
+    assert counter.greet_many("Hi", punctuation=".") == "Hi, Kate."
+    assert counter.count() == 2
+    assert counter.greet_many("Hi") == "Hi, Kate!"
+    assert counter.greet_many("Hello") == "Hello, Kate!"
+    assert counter.count() == 3
+    assert counter.greet_many("Hi") == "Hi, Kate!"
+    assert counter.count() == 3
+    assert counter.greet_many("Hi", punctuation=".") == "Hi, Kate."
+    assert counter.count() == 4
+
+
+def test_memoize_method_error():
+    """Errors should not be cached."""
+
+    class User:
+        def __init__(self, names):
+            self.names = names
+
+        @memoize
+        def first(self):
+            return self.names.pop(0)
+
+    user = private(User)([])
+    with pytest.raises(IndexError):
+        user.first()
+    with pytest.raises(IndexError):
+        user.first()
+
+
+def test_invalidate_memoized_methods():
+    """Forget memoized results on demand."""
+    counter = private(_Counter)("Kate")
+    counter.greet()
+    counter.greet_many("Hi")
+    invalidate(counter)
+    counter.greet()
+    counter.greet_many("Hi")
+    assert counter.count() == 4
+
+
+def test_memoize_inside_methods():
+    """Origin methods should call memoized methods without cache."""
+    counter = private(_Counter)("Kate")
+    assert counter.polite() == "Hello, Kate"
+    assert counter.polite() == "Hello, Kate"
+    assert counter.count() == 2
+
+
+def test_memoize_cache_is_hidden():
+    """Memoized results should not be reachable from the client code."""
+    counter = private(_Counter)("Kate")
+    counter.greet()
+    assert not hasattr(counter, "_memoized")
+    assert not hasattr(type(counter), "_memoized")
+
+
+def test_memoize_signature():
+    """Memoized methods should have signature of the origin method."""
+    counter = private(_Counter)("Kate")
+    assert signature(counter.greet) == signature(_Counter("Kate").greet)
+    expected = signature(_Counter("Kate").greet_many)
+    assert signature(counter.greet_many) == expected
+
+
+def test_memoize_results_are_private():
+    """Memoized methods should return private instances."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        @memoize
+        def itself(self):
+            return self
+
+        def greet(self):
+            raise RuntimeError
+
+    user_class = private(User)
+    user = user_class("Kate")
+    assert type(user.itself()) is user_class
+    assert user.itself() is user.itself()
+
+
+def test_evict_changed_argument():
+    """Results of arguments changed after the call should be evicted quietly."""
+
+    class Key:
+        def __init__(self, value):
+            self.value = value
+
+        def __hash__(self):
+            return hash(self.value)
+
+    class Calculator:
+        def __init__(self, base):
+            self.base = base
+
+        @memoize(size=1)
+        def add(self, key):
+            return self.base + key.value
+
+    calculator = private(Calculator)(10)
+    key = Key(1)
+    assert calculator.add(key) == 11
+    key.value = 2
+    assert calculator.add(Key(3)) == 13
+
+
+@pytest.mark.parametrize("size", [0, -1, 1.5, True])
+def test_deny_invalid_cache_size(size):
+    """Cache size should be a positive integer."""
+    with pytest.raises(GenericClassError) as exc_info:
+        memoize(size=size)
+    expected = "Memoize cache size should be a positive integer"
+    assert str(exc_info.value) == expected
+
+
+def test_deny_coroutine_and_generator_methods():
+    """Only methods returning values could be memoized."""
+
+    async def greet(self):
+        pass  # pragma: no cover
+
+    def stream(self):
+        yield  # pragma: no cover
+
+    for method in [greet, stream]:
+        with pytest.raises(GenericClassError) as exc_info:
+            memoize(method)
+        expected = "Coroutine and generator methods could not be memoized"
+        assert str(exc_info.value) == expected
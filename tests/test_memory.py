@@ -0,0 +1,155 @@
+"""Tests related to memory used by private instances."""
+import asyncio
+import gc
+import tracemalloc
+from datetime import date
+from weakref import ref
+
+import pytest
+
+from generics import delegate
+from generics import private
+
+
+@pytest.fixture()
+def collections():
+    """Count cyclic garbage collections."""
+    found = []
+
+    def callback(phase, info):  # pragma: no cover
+        found.append((phase, info["generation"]))
+
+    _collect()
+    gc.callbacks.append(callback)
+    yield found
+    gc.callbacks.remove(callback)
+
+
+@pytest.fixture()
+def garbage():
+    """Leave cyclic garbage to the explicit collection."""
+    _collect()
+    gc.disable()
+    yield gc.collect
+    gc.enable()
+
+
+def _collect():
+    # Classes decorated by previous tests are released in more than one pass.
+    while gc.collect():
+        pass
+
+
+def _create(user_class, size=100_000):
+    for _ in range(size):
+        user_class(name="Kate").greet()
+
+
+def _use(user_class, size=10_000):
+    for _ in range(size):
+        user = user_class(name="Kate")
+        user.rename("Jeff").greet()
+        [user] = user.split(["Jeff"], list)
+        next(user.stream("Jeff"))
+
+
+def test_instances_without_cycles(e, garbage):
+    """Instances should be freed by reference counting."""
+    user_class = private(e.TeamUser, containers=True)
+    _create(user_class)
+    _use(user_class)
+    assert garbage() == 0
+
+
+def test_delegates_without_cycles(e, w, garbage):
+    """Dispatched methods should be freed by reference counting."""
+    user_class = private(e.User)
+    for _ in range(10_000):
+        user = user_class(last_login=date(1999, 12, 31))
+        w.SmartUser(user).is_active()
+        w.CachedSmartUser(user).is_active()
+    assert garbage() == 0
+
+
+def test_frozen_instances_without_cycles(e, garbage):
+    """Frozen and interned instances should be freed by reference counting."""
+    frozen_class = private(e.TeamUser, containers=True, frozen=True)
+    interned_class = private(e.TeamUser, containers=True, frozen=True, intern=True)
+    _use(frozen_class)
+    _use(interned_class)
+    assert garbage() == 0
+
+
+def test_batches_released_with_loop():
+    """Calls not flushed before their loop is closed should be freed with it."""
+
+    @private
+    class Repository:
+        def __init__(self, table):
+            self.table = table
+
+        def is_batched(self):
+            raise RuntimeError
+
+        @delegate(batch=60)
+        async def batch(self, name, calls):
+            raise RuntimeError
+
+    repository = Repository("users")
+
+    async def load():
+        repository.get(1)
+        return ref(asyncio.get_running_loop())
+
+    reference = asyncio.run(load())
+    _collect()
+    assert reference() is None
+
+
+def test_instances_without_collections(e, collections):
+    """Instances should not trigger cyclic garbage collection."""
+    user_class = private(e.TeamUser, containers=True)
+    _create(user_class)
+    _use(user_class)
+    assert collections == []
+
+
+def test_instances_without_objects_growth(e):
+    """Dropped instances should not leave objects behind."""
+    user_class = private(e.TeamUser, containers=True)
+    _use(user_class, 10)
+    _collect()
+    before = len(gc.get_objects())
+    _create(user_class)
+    _use(user_class)
+    _collect()
+    assert len(gc.get_objects()) <= before
+
+
+def test_instances_without_memory_growth():
+    """Memory used by dropped instances should be returned."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def greet(self):
+            return f"Hello, {self.name}"
+
+    user_class = private(User)
+    tracemalloc.start()
+    try:
+        _create(user_class, 1000)
+        before, _ = tracemalloc.get_traced_memory()
+        _create(user_class)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert after - before < 1024
+
+
+def test_private_class_released(e):
+    """Private class should not be kept alive by the library."""
+    reference = ref(private(e.TeamUser))
+    gc.collect()
+    assert reference() is None
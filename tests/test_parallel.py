@@ -0,0 +1,99 @@
+"""Tests related to the parallel_map function."""
+import pytest
+
+from generics import parallel_map
+from generics import private
+from generics.exceptions import GenericClassError
+from generics.exceptions import GenericInstanceError
+
+
+def test_call_method_in_processes():
+    """Method should be called on every instance in the order of instances."""
+    users = [_User(name) for name in ["Kate", "Jeff", "John"]]
+    greetings = parallel_map(users, "greet", chunksize=2, processes=2)
+    assert list(greetings) == ["Hello, Kate", "Hello, Jeff", "Hello, John"]
+
+
+def test_return_class_instances():
+    """Instances returned from methods should be @private in the parent."""
+    users = [_User(name) for name in ["Kate", "Jeff"]]
+    renamed = list(parallel_map(users, "rename", "John", processes=1))
+    assert [type(user) for user in renamed] == [_User, _User]
+    assert [user.greet() for user in renamed] == ["Hello, John", "Hello, John"]
+
+
+def test_unordered_results():
+    """Results could be given as soon as chunks are done."""
+    users = [_User(name) for name in ["Kate", "Jeff", "John"]]
+    greetings = parallel_map(users, "greet", chunksize=1, ordered=False)
+    assert sorted(greetings) == ["Hello, Jeff", "Hello, John", "Hello, Kate"]
+
+
+def test_report_chunk_timing():
+    """Chunk number, size and duration should be reported."""
+    users = [_User(name) for name in ["Kate", "Jeff", "John"]]
+    chunks = []
+    results = parallel_map(
+        users,
+        "greet",
+        chunksize=2,
+        processes=1,
+        on_chunk=lambda *chunk: chunks.append(chunk),
+    )
+    list(results)
+    assert [(number, size) for number, size, _ in chunks] == [(0, 2), (1, 1)]
+    assert all(seconds >= 0 for _, _, seconds in chunks)
+
+
+def test_deny_unknown_method():
+    """Only public instance methods could be called."""
+    users = [_User("Kate")]
+    for name in ["name", "__init__", "__reduce_ex__"]:
+        with pytest.raises(GenericInstanceError) as exc_info:
+            parallel_map(users, name)
+        assert str(exc_info.value) == f"{name!r} is not a public instance method"
+
+
+def test_deny_not_private_instances(e):
+    """Only instances of classes decorated with @private could be used."""
+    with pytest.raises(GenericClassError) as exc_info:
+        parallel_map([e.NamedUser(name="Kate")], "greet")
+    assert str(exc_info.value) == "Class should be decorated with @private"
+
+
+def test_deny_classes_decorated_by_call(e):
+    """Worker processes should be able to find the class by its name."""
+    users = [private(e.NamedUser)(name="Kate")]
+    with pytest.raises(GenericClassError) as exc_info:
+        parallel_map(users, "greet")
+    expected = "Class should be decorated with @private at the module level"
+    assert str(exc_info.value) == expected
+
+
+def test_deny_local_classes():
+    """Worker processes should be able to find the class by its name."""
+
+    @private
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def greet(self):
+            raise RuntimeError
+
+    with pytest.raises(GenericClassError) as exc_info:
+        parallel_map([User("Kate")], "greet")
+    expected = "Class should be decorated with @private at the module level"
+    assert str(exc_info.value) == expected
+
+
+@private
+class _User:
+    def __init__(self, name):
+        self.name = name
+
+    def greet(self):
+        return f"Hello, {self.name}"
+
+    def rename(self, name):
+        return self.__class__(name)
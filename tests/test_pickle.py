@@ -0,0 +1,150 @@
+"""Tests related to pickle support of private instances."""
+import copy
+import gc
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from operator import methodcaller
+
+import pytest
+
+from generics import private
+from generics.exceptions import GenericClassError
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_private_instance(e, protocol):
+    """Private instances should survive pickle round trip."""
+    user_class = private(e.NamedUser)
+    user = pickle.loads(pickle.dumps(user_class(name="Kate"), protocol=protocol))
+    assert type(user) is user_class
+    assert user.greet() == "Hello, Kate"
+    assert not hasattr(user, "name")
+
+
+def test_pickle_decorated_class(e, w):
+    """Classes decorated at the module level should be found by name."""
+    user = w.SmartUser(e.NamedUser(name="Kate"))
+    user.greet()
+    restored = pickle.loads(pickle.dumps(user))
+    assert type(restored) is w.SmartUser
+    assert restored.was_called()
+    assert restored.greet() == "Hello, Kate"
+
+
+def test_pickle_local_class():
+    """Classes decorated in the current process should be found by name."""
+
+    @private
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def greet(self):
+            return f"Hello, {self.name}"
+
+    user = pickle.loads(pickle.dumps(User("Kate")))
+    assert type(user) is User
+    assert user.greet() == "Hello, Kate"
+
+
+def test_deny_unknown_class():
+    """Unpickling should fail if decorated class does not exist anymore."""
+
+    @private
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def greet(self):
+            raise RuntimeError
+
+    data = pickle.dumps(User("Kate"))
+    del User
+    gc.collect()
+    with pytest.raises(GenericClassError) as exc_info:
+        pickle.loads(data)
+    expected = "Can not find private class 'test_deny_unknown_class.<locals>.User'"
+    assert str(exc_info.value) == expected
+
+
+def test_copy_private_instance(e):
+    """Private instances should be copied as encapsulated instances."""
+    user_class = private(e.NamedUser)
+    user = user_class(name="Kate")
+    for copied in [copy.copy(user), copy.deepcopy(user)]:
+        assert type(copied) is user_class
+        assert copied is not user
+        assert copied.greet() == "Hello, Kate"
+
+
+def test_send_to_process_pool(e, w):
+    """Private instances should cross process boundaries."""
+    users = [w.SmartUser(e.NamedUser(name=name)) for name in ["Kate", "Jeff"]]
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        greetings = list(executor.map(methodcaller("greet"), users))
+    assert greetings == ["Hello, Kate", "Hello, Jeff"]
+
+
+def test_pickle_shared_references():
+    """Attributes shared by instances should stay shared after unpickling."""
+
+    @private
+    class User:
+        def __init__(self, name, tags):
+            self.name = name
+            self.tags = tags
+
+        def tag(self, tag):
+            self.tags.append(tag)
+
+        def greet(self):
+            return f"Hello, {self.name} {self.tags}"
+
+    tags = ["admin"]
+    kate, jeff = pickle.loads(pickle.dumps([User("Kate", tags), User("Jeff", tags)]))
+    kate.tag("root")
+    assert jeff.greet() == "Hello, Jeff ['admin', 'root']"
+
+
+def test_pickle_slots_instance():
+    """Slots of the origin instance should survive pickle round trip."""
+
+    @private
+    class User:
+        __slots__ = ("name",)
+
+        def __init__(self, name):
+            self.name = name
+
+        def greet(self):
+            return f"Hello, {self.name}"
+
+    user = pickle.loads(pickle.dumps(User("Kate")))
+    assert type(user) is User
+    assert user.greet() == "Hello, Kate"
+
+
+def test_pickle_import_module(e, w, monkeypatch):
+    """Modules of private classes should be imported if they were not yet."""
+    data = pickle.dumps(w.SmartUser(e.NamedUser(name="Kate")))
+    monkeypatch.delitem(sys.modules, w.__name__)
+    user = pickle.loads(data)
+    assert type(user) is sys.modules[w.__name__].SmartUser
+    assert user.greet() == "Hello, Kate"
+
+
+def test_pickle_stateless_instance():
+    """Instances without attributes should survive pickle round trip."""
+
+    @private
+    class Greeter:
+        def __init__(self, name):
+            pass
+
+        def greet(self):
+            return "Hello"
+
+    greeter = pickle.loads(pickle.dumps(Greeter("Kate")))
+    assert type(greeter) is Greeter
+    assert greeter.greet() == "Hello"
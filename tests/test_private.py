@@ -1,5 +1,10 @@
 """Tests related to the @private decorator."""
+import asyncio
+import sys
+import tracemalloc
 from datetime import date
+from inspect import signature
+from operator import methodcaller
 
 import pytest
 
@@ -24,6 +29,38 @@ def test_deny_attribute_access(e):
     assert str(exc_info.value) == expected
 
 
+def test_deny_encapsulated_instance_access(e):
+    """Encapsulated instance should not be reachable from the client code."""
+    user_class = private(e.User)
+    user = user_class(last_login=date.today())
+    assert not hasattr(user, "last_login")
+    assert not hasattr(user, "_instance")
+    assert not hasattr(user, "__dict__")
+
+
+def test_instance_size(e):
+    """Private instance should be smaller than a plain object holding a reference."""
+    user_class = private(e.User)
+    user = user_class(last_login=date.today())
+    holder = _Holder(e.User(last_login=date.today()))
+    assert sys.getsizeof(user) < sys.getsizeof(holder)
+
+
+def test_instance_memory_allocation(e):
+    """Encapsulation should cost less memory than a plain object holding a reference.
+
+    Memory allocated for private instances includes encapsulated instances as
+    well.  The difference is the cost of encapsulation.
+
+    """
+    user_class = private(e.User)
+    today = date.today()
+    users = _allocated(lambda: user_class(last_login=today))
+    origins = _allocated(lambda: e.User(last_login=today))
+    holders = _allocated(lambda: _Holder(e.User(last_login=today)))
+    assert users - origins < holders - origins
+
+
 def test_deny_magic_attribute_access(e):
     """Bound methods should not expose private attributes."""
     user_class = private(e.User)
@@ -32,6 +69,16 @@ def test_deny_magic_attribute_access(e):
         user.is_active.__self__.last_login
 
 
+def test_bound_method_refers_to_private_instance(e):
+    """Bound methods should refer to the private instance only."""
+    user_class = private(e.User)
+    user = user_class(last_login=date.today())
+    other = user_class(last_login=date.today())
+    assert user.is_active.__self__ is user
+    assert type(user.is_active) is type(other.is_active)
+    assert not hasattr(user.is_active, "__dict__")
+
+
 def test_instance_method_return_class_instance(e):
     """Instances returned from methods should be @private as well."""
     user_class = private(e.NamedUser)
@@ -43,6 +90,266 @@ def test_instance_method_return_class_instance(e):
     assert str(exc_info.value) == expected
 
 
+def test_coroutine_method_return_class_instance(e):
+    """Instances returned from coroutine methods should be @private as well."""
+    user_class = private(e.AsyncNamedUser)
+
+    async def rename():
+        user = await user_class(name="John").rename("Kate")
+        assert await user.greet() == "Hello, Kate"
+        return user
+
+    user = asyncio.run(rename())
+    with pytest.raises(AttributeError) as exc_info:
+        user.name
+    expected = "'Private::AsyncNamedUser' object has no attribute 'name'"
+    assert str(exc_info.value) == expected
+
+
+@pytest.mark.parametrize("container", [list, tuple])
+def test_instance_method_return_class_instances_in_sequence(e, container):
+    """Instances returned inside sequences should be @private as well."""
+    user_class = private(e.TeamUser, containers=True)
+    users = user_class(name="John").split(["Kate", "Jeff"], container)
+    assert type(users) is container
+    assert [type(user) for user in users] == [user_class, user_class]
+    assert [user.greet() for user in users] == ["Hello, Kate", "Hello, Jeff"]
+
+
+def test_instance_method_return_class_instances_in_set(e):
+    """Instances returned inside sets should be @private as well."""
+    if e.TeamUser.__hash__ is None:
+        pytest.skip("Declaration does not support hashable instances")
+    user_class = private(e.TeamUser, containers=True)
+    for container in [set, frozenset]:
+        users = user_class(name="John").split(["Kate", "Jeff"], container)
+        assert type(users) is container
+        assert {user.greet() for user in users} == {"Hello, Kate", "Hello, Jeff"}
+
+
+def test_instance_method_return_class_instances_in_dict(e):
+    """Instances returned as dict values should be @private as well."""
+    user_class = private(e.TeamUser, containers=True)
+    users = user_class(name="John").index(["Kate", "Jeff"])
+    assert list(users) == ["Kate", "Jeff"]
+    assert users["Kate"].greet() == "Hello, Kate"
+    assert type(users["Jeff"]) is user_class
+
+
+def test_container_without_class_instances_is_not_copied(e):
+    """Containers without instances to wrap should be returned as is."""
+    user_class = private(e.TeamUser, containers=True)
+    user = user_class(name="John")
+    for members in [["Kate", "Jeff"], ("Kate",), {"Kate"}, {"Kate": 1}, []]:
+        assert user.members(members) is members
+
+
+def test_container_rewrap_other_private_classes(e):
+    """Instances of any private class should be wrapped in containers."""
+    user_class = private(e.User)
+    team_class = private(e.TeamUser, containers=True)
+    last_login = date.today()
+    members = ["Kate", e.User(last_login=last_login), "Jeff"]
+    result = team_class(name="John").members(members)
+    assert result[::2] == ["Kate", "Jeff"]
+    assert type(result[1]) is user_class
+    assert members[1] is not result[1]
+    assert type(team_class(name="John").members(e.User(last_login))) is user_class
+
+
+def test_container_rewrap_own_class_decorated_twice(e):
+    """Instances of the own class should be wrapped by the calling class."""
+    user_class = private(e.TeamUser, containers=True)
+    other_class = private(e.TeamUser, containers=True)
+    users = user_class(name="John").split(["Kate"], list)
+    assert type(users[0]) is user_class
+    assert type(user_class(name="John").members(e.TeamUser("Jeff"))) is user_class
+    assert type(other_class(name="John").split(["Kate"], list)[0]) is other_class
+
+
+def test_container_rewrap_is_opt_in(e):
+    """Instances inside containers should not be wrapped by default."""
+    user_class = private(e.TeamUser)
+    users = user_class(name="John").split(["Kate"], list)
+    assert type(users[0]) is e.TeamUser
+
+
+def test_generator_method_yield_class_instances(e):
+    """Instances yielded from generator methods should be @private as well."""
+    user_class = private(e.TeamUser)
+    stream = user_class(name="John").stream("Kate")
+    assert not hasattr(stream, "generator")
+    user = next(stream)
+    assert type(user) is user_class
+    assert user.greet() == "Hello, Kate"
+    user = stream.send("Jeff")
+    assert type(user) is user_class
+    assert user.greet() == "Hello, Jeff"
+    with pytest.raises(StopIteration) as exc_info:
+        stream.send(None)
+    assert exc_info.value.value == "Done"
+    assert list(user_class(name="John").stream("")) == []
+
+
+def test_generator_method_throw_and_close(e):
+    """Generator methods should pass exceptions to the origin generator."""
+    user_class = private(e.TeamUser)
+    stream = user_class(name="John").stream("Kate")
+    next(stream)
+    with pytest.raises(ValueError, match="Stop"):
+        stream.throw(ValueError("Stop"))
+    with pytest.raises(StopIteration):
+        next(stream)
+    stream = user_class(name="John").stream("Kate")
+    next(stream)
+    stream.close()
+    with pytest.raises(StopIteration):
+        next(stream)
+
+
+def test_generator_method_handle_thrown_exception():
+    """Generator methods should end when they handle thrown exceptions."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def stream(self, name):
+            try:
+                yield User(name)
+            except ValueError:
+                return "Stopped"
+
+        async def stream_async(self, name):
+            try:
+                name = yield User(name)
+            except ValueError:
+                return
+            yield User(name)
+
+    user = private(User)("John")
+    stream = user.stream("Kate")
+    next(stream)
+    with pytest.raises(StopIteration) as exc_info:
+        stream.throw(ValueError("Stop"))
+    assert exc_info.value.value == "Stopped"
+
+    async def consume():
+        stream = user.stream_async("Kate")
+        await stream.__anext__()
+        with pytest.raises(StopAsyncIteration):
+            await stream.athrow(ValueError("Stop"))
+        stream = user.stream_async("Kate")
+        await stream.__anext__()
+        jeff = await stream.asend("Jeff")
+        with pytest.raises(StopAsyncIteration):
+            await stream.asend(None)
+        return jeff
+
+    assert type(asyncio.run(consume())) is type(user)
+
+
+def test_async_generator_method_yield_class_instances(e):
+    """Instances yielded from async generator methods should be @private as well."""
+    user_class = private(e.TeamUser)
+
+    async def consume():
+        stream = user_class(name="John").stream_async("Kate")
+        kate = await stream.__anext__()
+        jeff = await stream.asend("Jeff")
+        with pytest.raises(ValueError, match="Stop"):
+            await stream.athrow(ValueError("Stop"))
+        stream = user_class(name="John").stream_async("Kate")
+        await stream.__anext__()
+        await stream.aclose()
+        with pytest.raises(StopAsyncIteration):
+            await stream.__anext__()
+        assert [user async for user in user_class(name="John").stream_async("")] == []
+        return kate, jeff
+
+    kate, jeff = asyncio.run(consume())
+    assert type(kate) is user_class
+    assert type(jeff) is user_class
+    assert kate.greet() == "Hello, Kate"
+    assert jeff.greet() == "Hello, Jeff"
+
+
+def test_instance_method_signature(e):
+    """Bound methods should have signature of the origin method."""
+    user_class = private(e.NamedUser)
+    user = user_class(name="John")
+    origin = e.NamedUser(name="John")
+    assert signature(user.rename) == signature(origin.rename)
+    assert signature(user.greet) == signature(origin.greet)
+
+
+def test_instance_method_return_annotation():
+    """Results of methods annotated with other classes should not be wrapped."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def length(self) -> int:
+            return len(self.name)
+
+        def forget(self) -> None:
+            self.name = ""
+
+        def rename(self, name) -> "User":
+            return User(name)
+
+    user_class = private(User)
+    user = user_class("Kate")
+    assert user.length() == 4
+    assert type(user.rename("Jeff")) is user_class
+    assert user.forget() is None
+    assert signature(user.length).return_annotation is int
+    assert signature(user.forget).return_annotation is None
+
+
+def test_instance_method_argument_kinds():
+    """Methods should accept arguments of every kind."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def greet(self, greeting, /, *names, punctuation="!", **options):
+            return greeting, self.name, names, punctuation, options
+
+        def rename(self, result):
+            return User(result)
+
+        def shout(*args):
+            return args[0].name.upper()
+
+    user = private(User)("Kate")
+    origin = User("Kate")
+    expected = ("Hi", "Kate", ("Jeff",), "?", {"mood": "good"})
+    assert user.greet("Hi", "Jeff", punctuation="?", mood="good") == expected
+    with pytest.raises(TypeError):
+        user.greet(greeting="Hi")
+    assert signature(user.greet) == signature(origin.greet)
+    assert user.rename(result="Jeff").shout() == "JEFF"
+
+
+def test_instance_method_without_signature():
+    """Callable attributes without signature should accept any arguments."""
+
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def greet(self, greeting):
+            return f"{greeting}, {self.name}"
+
+        hello = methodcaller("greet", "Hello")
+
+    user = private(User)("Kate")
+    assert user.hello() == "Hello, Kate"
+
+
 def test_instance_method_should_not_work_with_class(e):
     """Deny to call instance methods using class attribute access."""
     user_class = private(e.User)
@@ -141,6 +448,29 @@ def test_class_representation(e):
     assert "Private::User" == repr(user.__class__)
 
 
+def test_class_signature(e):
+    """Decorated class should have signature of the origin class constructor."""
+    user_class = private(e.User)
+    expected = signature(e.User).parameters["last_login"]
+    assert list(signature(user_class).parameters.values()) == [expected]
+
+
+def test_deny_reinitialization(e):
+    """Constructor called on the existing instance should not replace it."""
+    user = private(e.NamedUser)(name="Kate")
+    user.__init__(name="Jeff")
+    assert user.greet() == "Hello, Kate"
+
+
+def test_instances_share_class(e):
+    """Instances should be created from the decorated class."""
+    user_class = private(e.NamedUser)
+    user = user_class(name="John")
+    renamed = user.rename("Kate")
+    assert type(user) is user_class
+    assert type(renamed) is user_class
+
+
 def test_instance_representation(e):
     """Origin instance representation should appears in the representation."""
     user_class = private(e.User)
@@ -161,3 +491,19 @@ def test_method_instance_representation(e):
     user = user_class(last_login=date.today())
     origin = e.User(last_login=date.today())
     assert f"Private::{origin!r}.is_active" == repr(user.is_active)
+
+
+class _Holder:
+    def __init__(self, instance):
+        self.instance = instance
+
+
+def _allocated(factory):
+    tracemalloc.start()
+    try:
+        instances = [factory() for _ in range(1000)]
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del instances
+    return allocated
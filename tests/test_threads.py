@@ -0,0 +1,97 @@
+"""Tests related to private instances shared between threads."""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+import pytest
+
+from generics import delegate
+from generics import memoize
+from generics import private
+
+
+@pytest.fixture()
+def _switch():
+    """Switch threads as often as possible to provoke races."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _run(target, threads=8):
+    # Results of futures raise errors of threads in the test.
+    barrier = Barrier(threads)
+
+    def run():
+        barrier.wait()
+        target()
+
+    with ThreadPoolExecutor(threads) as executor:
+        futures = [executor.submit(run) for _ in range(threads)]
+    for future in futures:
+        future.result()
+
+
+@pytest.mark.usefixtures("_switch")
+def test_shared_instance_methods(e):
+    """Methods of the shared instance should be called from many threads."""
+    user = private(e.TeamUser)(name="Kate")
+    user_class = type(user)
+
+    def target():
+        for number in range(1000):
+            assert user.greet() == "Hello, Kate"
+            assert type(user.rename(str(number))) is user_class
+
+    _run(target)
+
+
+@pytest.mark.usefixtures("_switch")
+def test_shared_delegate_cache():
+    """Dispatched methods cache should be evicted from many threads."""
+
+    @private
+    class Cached:
+        def __init__(self, instance):
+            self.instance = instance
+
+        @delegate(cache=1)
+        def dispatch(self, name, args, kwargs):
+            return getattr(self.instance, name)(*args, **kwargs)
+
+    cached = Cached("Kate")
+
+    def target():
+        for _ in range(1000):
+            assert cached.upper() == "KATE"
+            assert cached.lower() == "kate"
+
+    _run(target)
+
+
+@pytest.mark.usefixtures("_switch")
+def test_shared_memoize_cache():
+    """Memoized results should be evicted from many threads."""
+
+    @private
+    class Calculator:
+        def __init__(self, base):
+            self.base = base
+
+        @memoize(size=2)
+        def add(self, number):
+            return self.base + number
+
+        @memoize
+        def double(self):
+            return self.base * 2
+
+    calculator = Calculator(10)
+
+    def target():
+        for number in range(1000):
+            assert calculator.add(number % 5) == 10 + number % 5
+            assert calculator.double() == 20
+
+    _run(target)